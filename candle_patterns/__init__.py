@@ -16,7 +16,8 @@ Usage:
         print(f"Entry: {result.entry_price}, Stop: {result.stop_price}")
 """
 
-from .base import PatternResult, PatternDetector, ExitSignal
+from .base import PatternResult, PatternDetector, ExitSignal, Direction
+from .state import ATRState, EMAState, MACDState, VWAPState
 from .micro_pullback import MicroPullback
 from .news_momentum import NewsMomentum
 from .reversal import ReversalPatternDetector
@@ -35,6 +36,12 @@ __all__ = [
     "PatternResult",
     "PatternDetector",
     "ExitSignal",
+    "Direction",
+    # Incremental indicator state
+    "ATRState",
+    "EMAState",
+    "MACDState",
+    "VWAPState",
     # Trailing stop
     "calculate_trailing_stop",
     "TrailingStopState",
@@ -0,0 +1,371 @@
+"""
+Array Kernels
+=============
+
+Compiled loops behind PatternDetector's hot paths, all over float64
+column arrays:
+
+- scan_rejection / scan_reversal_tail / scan_bar_exits: exit-signal scans
+  returning first-match bar positions (-1 if none)
+- scan_bar_exits_batch: the same bar-local scans for many positions packed
+  into one set of arrays, one (stop, rejection, tail) row per position
+- ewma_adjust_false: a pandas-exact ewm(adjust=False) mean (_ewma_step,
+  which EMAState also uses for live updates), behind indicators.calculate_ema
+- ewma_adjust_false_multi: the same EMA for several periods at once, one
+  thread per period, behind indicators.calculate_all_emas
+- macd_adjust_false: calculate_macd()'s EMAs and signal line in one pass,
+  each the same _ewma_step recursion
+- session_vwap: calculate_vwap()'s per-session running VWAP in one pass
+- scan_surge_start: MicroPullback's prior-surge window search
+
+Kernels are compiled with Numba when available (see ``_njit.py``) and run
+as plain Python otherwise. Arithmetic mirrors the original row-based code
+exactly (no fastmath) so boundary comparisons give identical results.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from ._njit import njit, prange
+
+# Explicit signatures make Numba compile (or load from cache) at import
+# instead of on the first monitoring call. Inputs are read-only C-contiguous
+# float64 arrays: pandas copy-on-write hands out read-only views, and
+# as_kernel_array() brings every other input to the same type.
+_F8 = "Array(float64, 1, 'C', readonly=True)"
+_OHLC = ", ".join([_F8] * 4)
+_B1 = "Array(boolean, 1, 'C', readonly=True)"
+
+
+def as_kernel_array(values) -> np.ndarray:
+    """Return values as the read-only contiguous float64 array the kernels take.
+
+    Copies only when the dtype or layout has to change; the result is a
+    fresh view, so the caller's array flags are never touched.
+    """
+    arr = np.ascontiguousarray(values, dtype=np.float64).view()
+    arr.flags.writeable = False
+    return arr
+
+
+class BarArrays(NamedTuple):
+    """OHLCV columns pulled out of a bars frame once (see bar_arrays).
+
+    Detectors, the exit checks and the indicator helpers read bars through
+    this rather than indexing the frame per bar.
+    """
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+
+def bar_arrays(bars: pd.DataFrame) -> BarArrays:
+    """Extract OHLCV columns once; prices as kernel arrays.
+
+    volume is passed through as stored, or empty if the frame has no
+    volume column.
+    """
+    def prices(col: str) -> np.ndarray:
+        return as_kernel_array(bars[col].to_numpy(dtype=np.float64))
+
+    return BarArrays(
+        open=prices("open"),
+        high=prices("high"),
+        low=prices("low"),
+        close=prices("close"),
+        volume=bars["volume"].to_numpy() if "volume" in bars.columns else np.empty(0),
+    )
+
+
+@njit(f"boolean({_OHLC}, int64, boolean)", cache=True)
+def _is_rejection(open_, high, low, close, i, is_short):
+    """Bar i makes a new extreme vs bar i-1 then closes through it.
+
+    Longs (jackknife): higher high, close below prior low, red candle.
+    Shorts (bottoming): lower low, close above prior high, green candle.
+    """
+    if is_short:
+        return low[i] < low[i - 1] and close[i] > high[i - 1] and close[i] > open_[i]
+    return high[i] > high[i - 1] and close[i] < low[i - 1] and close[i] < open_[i]
+
+
+@njit(f"boolean({_OHLC}, int64, float64, boolean)", cache=True)
+def _is_reversal_tail(open_, high, low, close, i, entry_price, is_short):
+    """Bar i is an in-profit 2x-wick candle with its body in the opposite third.
+
+    Longs (topping tail): upper wick >= 2x body, body in lower third,
+    close > entry. Shorts (bottoming tail): lower wick >= 2x body, body in
+    upper third, close < entry.
+    """
+    candle_range = high[i] - low[i]
+    if candle_range < 0.01:
+        return False
+
+    body_top = max(open_[i], close[i])
+    body_bottom = min(open_[i], close[i])
+    body_size = body_top - body_bottom
+    if body_size < 0.005:
+        body_size = 0.005  # Prevent division by zero
+
+    body_position = (body_bottom - low[i]) / candle_range
+    if is_short:
+        lower_wick_ratio = (body_bottom - low[i]) / body_size
+        return lower_wick_ratio >= 2.0 and body_position >= 0.67 and close[i] < entry_price
+    upper_wick_ratio = (high[i] - body_top) / body_size
+    return upper_wick_ratio >= 2.0 and body_position <= 0.33 and close[i] > entry_price
+
+
+@njit(f"int64({_OHLC}, boolean)", cache=True)
+def scan_rejection(open_, high, low, close, is_short):
+    """First bar (from 1) that is a rejection of the bar before it."""
+    for i in range(1, close.shape[0]):
+        if _is_rejection(open_, high, low, close, i, is_short):
+            return i
+    return -1
+
+
+@njit(f"int64({_OHLC}, float64, boolean)", cache=True)
+def scan_reversal_tail(open_, high, low, close, entry_price, is_short):
+    """First bar that is an in-profit reversal tail."""
+    for i in range(close.shape[0]):
+        if _is_reversal_tail(open_, high, low, close, i, entry_price, is_short):
+            return i
+    return -1
+
+
+@njit(f"UniTuple(int64, 3)({_OHLC}, int64, float64, float64, boolean)", cache=True)
+def scan_bar_exits(open_, high, low, close, entry_idx, entry_price, stop_price, is_short):
+    """Single pass from the entry bar for all bar-local exit conditions.
+
+    Returns (stop_idx, rejection_idx, tail_idx) as absolute positions,
+    -1 where the condition never occurs. The stop is checked from the entry
+    bar itself; rejection and tail only look at bars after entry.
+    """
+    stop_idx = -1
+    rejection_idx = -1
+    tail_idx = -1
+    for i in range(entry_idx, close.shape[0]):
+        if stop_idx < 0:
+            if is_short:
+                if high[i] >= stop_price:
+                    stop_idx = i
+            elif low[i] <= stop_price:
+                stop_idx = i
+        if rejection_idx < 0 and i > entry_idx + 1:
+            if _is_rejection(open_, high, low, close, i, is_short):
+                rejection_idx = i
+        if tail_idx < 0 and i > entry_idx:
+            if _is_reversal_tail(open_, high, low, close, i, entry_price, is_short):
+                tail_idx = i
+        if stop_idx >= 0 and rejection_idx >= 0 and tail_idx >= 0:
+            break
+    return stop_idx, rejection_idx, tail_idx
+
+
+# Compiled lazily on first use: eager compilation of a parallel kernel at
+# import starts Numba's threading layer, which deadlocks forked workers
+# (detect_batch's process pool).
+@njit(cache=True, parallel=True)
+def scan_bar_exits_batch(open_, high, low, close, offsets, entry_idxs, entry_prices, stop_prices, is_short):
+    """scan_bar_exits for many symbols packed end to end, in parallel.
+
+    Symbol s owns rows offsets[s]:offsets[s + 1] of the flat arrays;
+    entry_idxs are relative to that slice. Returns an (n_symbols, 3) array
+    of (stop_idx, rejection_idx, tail_idx), also relative, -1 if absent.
+    """
+    n_symbols = offsets.shape[0] - 1
+    out = np.full((n_symbols, 3), -1, dtype=np.int64)
+    for s in prange(n_symbols):
+        lo = offsets[s]
+        hi = offsets[s + 1]
+        stop_idx, rejection_idx, tail_idx = scan_bar_exits(
+            open_[lo:hi], high[lo:hi], low[lo:hi], close[lo:hi],
+            entry_idxs[s], entry_prices[s], stop_prices[s], is_short[s],
+        )
+        out[s, 0] = stop_idx
+        out[s, 1] = rejection_idx
+        out[s, 2] = tail_idx
+    return out
+
+
+def span_alpha(span: int) -> float:
+    """EWM smoothing factor for a span, computed the way pandas does."""
+    com = (span - 1) / 2.0
+    return 1.0 / (1.0 + com)
+
+
+@njit("UniTuple(float64, 2)(float64, float64, float64, float64, float64)", cache=True)
+def _ewma_step(weighted, old_wt, cur, alpha, old_wt_factor):
+    """One ``ewm(adjust=False)`` update: returns the new (weighted, old_wt).
+
+    Follows pandas' update order (weights renormalised each step, NaNs
+    decay the old weight without resetting it) so outputs are bit-for-bit
+    identical, not just close. Every EWMA here goes through this step.
+    """
+    is_observation = cur == cur
+    if weighted == weighted:
+        old_wt *= old_wt_factor
+        if is_observation:
+            if weighted != cur:
+                weighted = old_wt * weighted + alpha * cur
+                weighted /= old_wt + alpha
+            old_wt = 1.0
+    elif is_observation:
+        weighted = cur
+    return weighted, old_wt
+
+
+@njit(f"float64[::1]({_F8}, float64)", cache=True)
+def ewma_adjust_false(x, alpha):
+    """``ewm(alpha=alpha, adjust=False).mean()`` over x, one _ewma_step per bar."""
+    n = x.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+
+    old_wt_factor = 1.0 - alpha
+    weighted = x[0]
+    old_wt = 1.0
+    out[0] = weighted
+    for i in range(1, n):
+        weighted, old_wt = _ewma_step(weighted, old_wt, x[i], alpha, old_wt_factor)
+        out[i] = weighted
+    return out
+
+
+@njit(f"UniTuple(float64[::1], 2)({_F8}, float64, float64, float64)", cache=True)
+def macd_adjust_false(x, fast_alpha, slow_alpha, signal_alpha):
+    """MACD and signal lines in one pass over the closes.
+
+    The fast and slow EMAs, their difference and the signal EMA of that
+    difference are all advanced per bar with _ewma_step, so the result
+    equals three separate ``ewm(adjust=False)`` passes exactly while
+    reading each close once.
+    """
+    n = x.shape[0]
+    macd = np.empty(n)
+    signal = np.empty(n)
+    if n == 0:
+        return macd, signal
+
+    fast_factor = 1.0 - fast_alpha
+    slow_factor = 1.0 - slow_alpha
+    signal_factor = 1.0 - signal_alpha
+    fast = x[0]
+    slow = x[0]
+    fast_wt = 1.0
+    slow_wt = 1.0
+    signal_wt = 1.0
+    macd[0] = fast - slow
+    sig = macd[0]
+    signal[0] = sig
+    for i in range(1, n):
+        fast, fast_wt = _ewma_step(fast, fast_wt, x[i], fast_alpha, fast_factor)
+        slow, slow_wt = _ewma_step(slow, slow_wt, x[i], slow_alpha, slow_factor)
+        macd[i] = fast - slow
+        sig, signal_wt = _ewma_step(sig, signal_wt, macd[i], signal_alpha, signal_factor)
+        signal[i] = sig
+    return macd, signal
+
+
+# Compiled lazily for the same reason as scan_bar_exits_batch.
+@njit(cache=True, parallel=True)
+def ewma_adjust_false_multi(x, alphas):
+    """ewma_adjust_false over x for every alpha, one period per thread.
+
+    Returns a (len(alphas), len(x)) array so each thread writes its own
+    contiguous row. Every row is the same _ewma_step recursion as the
+    single-period kernel, so results match it (and pandas) exactly.
+    """
+    n = x.shape[0]
+    out = np.empty((alphas.shape[0], n))
+    if n == 0:
+        return out
+
+    for j in prange(alphas.shape[0]):
+        alpha = alphas[j]
+        old_wt_factor = 1.0 - alpha
+        weighted = x[0]
+        old_wt = 1.0
+        out[j, 0] = weighted
+        for i in range(1, n):
+            weighted, old_wt = _ewma_step(weighted, old_wt, x[i], alpha, old_wt_factor)
+            out[j, i] = weighted
+    return out
+
+
+@njit(f"float64[::1]({_F8}, {_F8}, {_B1})", cache=True)
+def session_vwap(tp_volume, volume, after_reset):
+    """calculate_vwap()'s reset branch: running TP*V over running V per side
+    of the reset time, in one pass.
+
+    Each side keeps its own sums, updated with the compensated (Kahan) steps
+    pandas' groupby cumsum uses. NaN inputs give NaN at that bar and are
+    skipped. A zero or overflowing quotient becomes NaN, as the inf
+    replacement did.
+    """
+    n = tp_volume.shape[0]
+    out = np.empty(n)
+    sum_tpv = np.zeros(2)
+    comp_tpv = np.zeros(2)
+    sum_vol = np.zeros(2)
+    comp_vol = np.zeros(2)
+    for i in range(n):
+        side = 1 if after_reset[i] else 0
+        cum_tpv = np.nan
+        if tp_volume[i] == tp_volume[i]:
+            y = tp_volume[i] - comp_tpv[side]
+            t = sum_tpv[side] + y
+            comp_tpv[side] = t - sum_tpv[side] - y
+            sum_tpv[side] = t
+            cum_tpv = t
+        cum_vol = np.nan
+        if volume[i] == volume[i]:
+            y = volume[i] - comp_vol[side]
+            t = sum_vol[side] + y
+            comp_vol[side] = t - sum_vol[side] - y
+            sum_vol[side] = t
+            cum_vol = t
+
+        if cum_vol == 0.0:
+            out[i] = np.nan
+        else:
+            vwap = cum_tpv / cum_vol
+            out[i] = np.nan if np.isinf(vwap) else vwap
+    return out
+
+
+@njit(f"int64({_OHLC}, int64, int64, int64, float64)", cache=True)
+def scan_surge_start(open_, high, low, close, end_idx, min_len, max_len, min_move_pct):
+    """Start of the shortest mostly-green window ending at end_idx with a
+    low-to-high move of at least min_move_pct, or -1.
+
+    Window lengths run from min_len up to max_len (inclusive). Running
+    low/high skip NaN like Series.min()/max(), and the move uses
+    calculate_move_pct's arithmetic, so the chosen window is the same as a
+    pandas slice-per-length search.
+    """
+    window_low = np.nan
+    window_high = np.nan
+    green = 0
+    for length in range(1, max_len + 1):
+        i = end_idx - length + 1
+        if i < 0:
+            break
+        if window_low != window_low or low[i] < window_low:
+            window_low = low[i]
+        if window_high != window_high or high[i] > window_high:
+            window_high = high[i]
+        if close[i] > open_[i]:
+            green += 1
+        if length < min_len:
+            continue
+
+        move_pct = 0.0 if window_low == 0 else ((window_high - window_low) / window_low) * 100
+        if move_pct >= min_move_pct and green / length >= 0.5:
+            return i
+    return -1
@@ -0,0 +1,30 @@
+"""
+Optional Numba Support
+======================
+
+Numba is an optional dependency (``pip install candle-patterns[fast]``).
+When it is installed, kernels decorated with ``njit`` are JIT-compiled;
+otherwise ``njit`` returns the function unchanged and the same kernels run
+as plain Python over NumPy arrays.
+"""
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (bare or with options)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ["HAS_NUMBA", "njit", "prange"]
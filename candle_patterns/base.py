@@ -6,13 +6,53 @@ Abstract base class for all pattern detectors.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Tuple, Union
+import numpy as np
 import pandas as pd
 
+from ._kernels import (
+    BarArrays,
+    as_kernel_array,
+    bar_arrays,
+    scan_bar_exits,
+    scan_bar_exits_batch,
+    scan_rejection,
+    scan_reversal_tail,
+)
+from .indicators.macd import _cached_macd_arrays
+from .state import MACDState
+
+
+class Direction(IntEnum):
+    """Trade direction. The value is the sign of a favourable price move."""
+    LONG = 1
+    SHORT = -1
+
+    @classmethod
+    def of(cls, direction: Union[str, "Direction"]) -> "Direction":
+        """Convert "long"/"short" (or a Direction) at the API boundary.
+
+        Anything other than "short" is treated as long, as the string
+        comparisons this replaces did.
+        """
+        return _DIRECTIONS.get(direction, cls.LONG)
+
+
+_DIRECTIONS: Dict[Any, Direction] = {
+    "long": Direction.LONG,
+    "short": Direction.SHORT,
+    Direction.LONG: Direction.LONG,
+    Direction.SHORT: Direction.SHORT,
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class ExitSignal:
     """Exit signal detected during trade monitoring."""
     signal_type: str  # "macd_cross", "volume_decline", "jackknife", "stop_hit"
@@ -22,7 +62,7 @@ class ExitSignal:
     price: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PatternResult:
     """Result of pattern detection."""
 
@@ -82,6 +122,68 @@ class PatternResult:
             return None
         return reward / risk
 
+    @staticmethod
+    def calc_risk_reward_batch(
+        results: List["PatternResult"], target_prices: Any
+    ) -> np.ndarray:
+        """
+        Vectorized calc_risk_reward() over many results.
+
+        Args:
+            results: PatternResults to evaluate
+            target_prices: One target per result (array-like) or a single
+                target applied to all
+
+        Returns:
+            float64 array of R:R ratios, NaN where calc_risk_reward()
+            would return None (missing entry/stop or zero risk)
+        """
+        count = len(results)
+        entries = np.fromiter(
+            (np.nan if r.entry_price is None else r.entry_price for r in results),
+            dtype=np.float64, count=count,
+        )
+        stops = np.fromiter(
+            (np.nan if r.stop_price is None else r.stop_price for r in results),
+            dtype=np.float64, count=count,
+        )
+        risks = np.abs(entries - stops)
+        rewards = np.abs(np.asarray(target_prices, dtype=np.float64) - entries)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where((risks == 0) | np.isnan(risks), np.nan, rewards / risks)
+
+    @staticmethod
+    def to_frame(results: List["PatternResult"], index: Any = None) -> pd.DataFrame:
+        """One row per result, one column per field (e.g. for detect_many output)."""
+        return pd.DataFrame(
+            {f.name: [getattr(r, f.name) for r in results] for f in fields(PatternResult)},
+            index=index,
+        )
+
+
+# Columns shipped to worker processes by detect_batch(). Wide market-data
+# frames (quotes, indicators) are trimmed to what detectors actually read.
+_BATCH_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+
+def _batch_columns(bars: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Raw arrays for the _BATCH_COLUMNS present in bars."""
+    return {col: bars[col].to_numpy() for col in _BATCH_COLUMNS if col in bars.columns}
+
+
+def _detect_in_worker(
+    detector: "PatternDetector",
+    index: pd.Index,
+    columns: Dict[str, Any],
+    vwap: Optional[pd.Series] = None,
+    macd: Optional[pd.DataFrame] = None,
+    prev_close: Optional[float] = None,
+) -> "PatternResult":
+    """Rebuild the bars frame from raw column arrays and run detect()."""
+    return detector.detect(
+        pd.DataFrame(columns, index=index), vwap=vwap, macd=macd, prev_close=prev_close
+    )
+
 
 class PatternDetector(ABC):
     """
@@ -109,16 +211,40 @@ class PatternDetector(ABC):
             config: Dictionary of pattern-specific parameters
             exit_config: Pattern-specific exit/trailing stop configuration
         """
-        self.config = self.default_config()
+        self.config = self._fresh_default_config()
         if config:
             self.config.update(config)
         self.exit_config = exit_config  # Pattern-specific exit config (or None for global)
+        self._macd_state: Optional[MACDState] = None  # Live per-bar MACD (update_macd)
 
     @abstractmethod
     def default_config(self) -> Dict[str, Any]:
         """Return default configuration for this pattern."""
         pass
 
+    def _fresh_default_config(self) -> Dict[str, Any]:
+        """A new, caller-owned copy of default_config().
+
+        default_config() is evaluated once per detector class and kept as a
+        read-only mapping; each instance copies it instead of rebuilding
+        the literal. Container values (e.g. lists) are copied too, so
+        mutating one instance's config never leaks into another's.
+        """
+        cls = type(self)
+        cached = cls.__dict__.get("_default_config_cache")
+        if cached is None:
+            defaults = self.default_config()
+            mutable_keys = tuple(
+                key for key, value in defaults.items() if isinstance(value, (list, dict, set))
+            )
+            cached = (MappingProxyType(defaults), mutable_keys)
+            cls._default_config_cache = cached
+        defaults, mutable_keys = cached
+        config = dict(defaults)
+        for key in mutable_keys:
+            config[key] = config[key].copy()
+        return config
+
     @abstractmethod
     def detect(
         self,
@@ -167,6 +293,107 @@ class PatternDetector(ABC):
 
         return True
 
+    def detect_batch(
+        self,
+        bars_by_symbol: Dict[str, pd.DataFrame],
+        max_workers: Optional[int] = None,
+        vwap_by_symbol: Optional[Dict[str, pd.Series]] = None,
+        macd_by_symbol: Optional[Dict[str, pd.DataFrame]] = None,
+        prev_close_by_symbol: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, PatternResult]:
+        """
+        Run detect() for many symbols in parallel worker processes.
+
+        Detection is CPU-bound and independent per symbol, so a process
+        pool scales with core count. Only the OHLCV (+ timestamp) columns
+        are passed to detect(), as plain NumPy arrays; the serial path
+        trims the frame the same way so both paths see identical input.
+
+        Instance state (e.g. NewsMomentum's _current_metadata) is shared by
+        every symbol in the batch; per-symbol metadata needs separate calls.
+
+        Args:
+            bars_by_symbol: Mapping of symbol -> OHLCV DataFrame
+            max_workers: Worker process count (None = os.cpu_count());
+                1 runs serially in this process
+            vwap_by_symbol: Optional mapping of symbol -> VWAP series
+            macd_by_symbol: Optional mapping of symbol -> MACD DataFrame
+            prev_close_by_symbol: Optional mapping of symbol -> previous close
+
+        Returns:
+            Mapping of symbol -> PatternResult
+        """
+        vwaps = vwap_by_symbol or {}
+        macds = macd_by_symbol or {}
+        prev_closes = prev_close_by_symbol or {}
+
+        if max_workers == 1 or len(bars_by_symbol) <= 1:
+            return {
+                symbol: _detect_in_worker(
+                    self, bars.index, _batch_columns(bars),
+                    vwaps.get(symbol), macds.get(symbol), prev_closes.get(symbol),
+                )
+                for symbol, bars in bars_by_symbol.items()
+            }
+
+        results: Dict[str, PatternResult] = {}
+        # Spawned (not forked) workers: forking after Numba's parallel
+        # threading layer has started (check_exit_signals_batch) deadlocks
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = {}
+            for symbol, bars in bars_by_symbol.items():
+                future = executor.submit(
+                    _detect_in_worker, self, bars.index, _batch_columns(bars),
+                    vwaps.get(symbol), macds.get(symbol), prev_closes.get(symbol),
+                )
+                futures[future] = symbol
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        return {symbol: results[symbol] for symbol in bars_by_symbol}
+
+    def detect_many(
+        self,
+        bars: pd.DataFrame,
+        end_indices: Any,
+        vwap: Optional[pd.Series] = None,
+        macd: Optional[pd.DataFrame] = None,
+        prev_close: Optional[float] = None,
+    ) -> List[PatternResult]:
+        """
+        Run detect() on the growing windows bars[:end + 1], for backtests.
+
+        Equivalent to calling detect() on each window. The close-history
+        MACD is computed once up front and each window's calculate_macd()
+        call is answered from its prefix; vwap/macd (aligned with bars) are
+        sliced the same way. PatternResult.to_frame() turns the results
+        into a DataFrame.
+
+        Args:
+            bars: Full OHLCV history
+            end_indices: Positions of the last bar of each window
+            vwap: Optional VWAP series covering all bars
+            macd: Optional MACD DataFrame covering all bars
+            prev_close: Optional previous day's close, shared by all windows
+
+        Returns:
+            One PatternResult per end index, in input order
+        """
+        df = self._positional(bars)
+        if len(df):
+            self._macd_arrays(df["close"])  # Prime the prefix cache
+        results = []
+        for end in end_indices:
+            stop = int(end) + 1
+            results.append(self.detect(
+                df.iloc[:stop],
+                vwap=None if vwap is None else vwap.iloc[:stop],
+                macd=None if macd is None else macd.iloc[:stop],
+                prev_close=prev_close,
+            ))
+        return results
+
     def is_green_candle(self, row: pd.Series) -> bool:
         """Check if candle is green (close > open)."""
         return row["close"] > row["open"]
@@ -183,12 +410,40 @@ class PatternDetector(ABC):
         body = abs(row["close"] - row["open"])
         return (body / total_range) * 100
 
+    @staticmethod
+    def is_green_arr(opens: np.ndarray, closes: np.ndarray) -> np.ndarray:
+        """Vectorized is_green_candle(): boolean mask of close > open."""
+        return closes > opens
+
+    @staticmethod
+    def is_red_arr(opens: np.ndarray, closes: np.ndarray) -> np.ndarray:
+        """Vectorized is_red_candle(): boolean mask of close < open."""
+        return closes < opens
+
+    @staticmethod
+    def candle_body_pct_arr(
+        opens: np.ndarray, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized candle_body_pct(): body as % of range, 0.0 where range is 0."""
+        total_range = np.asarray(highs - lows, dtype=np.float64)
+        body = np.abs(closes - opens)
+        pct = np.divide(body, total_range, out=np.zeros_like(total_range), where=total_range != 0)
+        return pct * 100
+
     def calculate_move_pct(self, start_price: float, end_price: float) -> float:
         """Calculate percentage move between two prices."""
         if start_price == 0:
             return 0.0
         return ((end_price - start_price) / start_price) * 100
 
+    @staticmethod
+    def calculate_move_pct_arr(start_prices: np.ndarray, end_prices: np.ndarray) -> np.ndarray:
+        """Vectorized calculate_move_pct(): % move per element, 0.0 where start is 0."""
+        start = np.asarray(start_prices, dtype=np.float64)
+        change = np.asarray(end_prices - start, dtype=np.float64)
+        move = np.divide(change, start, out=np.zeros_like(change), where=start != 0)
+        return move * 100
+
     def calculate_macd(
         self,
         closes: pd.Series,
@@ -207,41 +462,101 @@ class PatternDetector(ABC):
 
         Returns:
             DataFrame with 'macd', 'signal', 'histogram' columns,
-            or None if insufficient bars
+            or None if insufficient bars. The lines come from the MACD
+            cache, but each call builds a new frame the caller owns.
         """
-        min_bars = max(fast, 2)  # EWM seeds from first value; directionally useful early
-        if len(closes) < min_bars:
+        lines = self._macd_arrays(closes, fast, slow, signal)
+        if lines is None:
             return None
 
-        fast_ema = closes.ewm(span=fast, adjust=False).mean()
-        slow_ema = closes.ewm(span=slow, adjust=False).mean()
-        macd_line = fast_ema - slow_ema
-        signal_line = macd_line.ewm(span=signal, adjust=False).mean()
-        histogram = macd_line - signal_line
-
+        macd_line, signal_line, histogram = lines
         return pd.DataFrame({
             "macd": macd_line,
             "signal": signal_line,
             "histogram": histogram,
-        })
+        }, index=closes.index)
+
+    def _macd_arrays(
+        self,
+        closes: pd.Series,
+        fast: int = 12,
+        slow: int = 26,
+        signal: int = 9,
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        calculate_macd() as raw (macd, signal, histogram) arrays.
+
+        Positional consumers (the exit checks) read these directly and
+        never pay for the DataFrame. Lines come from indicators.macd's
+        cache, shared by every detector and the indicator query helpers,
+        and are read-only.
+        """
+        min_bars = max(fast, 2)  # EWM seeds from first value; directionally useful early
+        if len(closes) < min_bars:
+            return None
+        return _cached_macd_arrays(closes, fast, slow, signal)
+
+    def _macd_lines(
+        self, closes: pd.Series, macd: Optional[pd.DataFrame] = None
+    ) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        (macd line, histogram) as arrays for detect()'s confirmations.
+
+        Taken from a caller-supplied MACD frame when given (either column
+        may be missing), else computed via _macd_arrays() without building
+        calculate_macd()'s DataFrame. (None, None) if too few bars.
+        """
+        if macd is None:
+            lines = self._macd_arrays(closes)
+            return (None, None) if lines is None else (lines[0], lines[2])
+        return (
+            macd["macd"].to_numpy() if "macd" in macd.columns else None,
+            macd["histogram"].to_numpy() if "histogram" in macd.columns else None,
+        )
+
+    def seed_macd(self, closes: pd.Series) -> None:
+        """Start the live MACD (see update_macd) from historical closes."""
+        self._macd_state = MACDState.from_closes(closes.to_numpy())
+
+    def update_macd(self, close: float) -> Tuple[float, float, float]:
+        """
+        Advance the live MACD by one bar in O(1).
+
+        For streaming use: call once per new bar close instead of
+        recomputing calculate_macd() over the whole history. Values match
+        calculate_macd() exactly. Without seed_macd(), the first call
+        starts a fresh 12/26/9 state from this close.
+
+        Returns:
+            (macd, signal, histogram) for the new bar
+        """
+        if self._macd_state is None:
+            self._macd_state = MACDState.create()
+        return self._macd_state.update(close)
 
     @staticmethod
-    def _avg_volume(df: pd.DataFrame, start_idx: int, end_idx: int) -> float:
-        """Average volume for bars in [start_idx, end_idx] inclusive, skipping zero-volume."""
-        vols = [
-            df.iloc[i]["volume"]
-            for i in range(start_idx, end_idx + 1)
-            if df.iloc[i]["volume"] > 0
-        ]
-        return sum(vols) / len(vols) if vols else 0.0
+    def _avg_volume(
+        df: pd.DataFrame, start_idx: int, end_idx: int, volumes: Optional[np.ndarray] = None
+    ) -> float:
+        """Average volume for bars in [start_idx, end_idx] inclusive, skipping zero-volume.
+
+        Pass volumes (the column as an array) when calling repeatedly on
+        the same bars to skip the column lookup.
+        """
+        if volumes is None:
+            volumes = df["volume"].to_numpy()
+        vols = volumes[start_idx:end_idx + 1]
+        traded = vols[vols > 0]
+        return traded.sum() / traded.size if traded.size else 0.0
 
     @staticmethod
-    def _has_halt_bar(df: pd.DataFrame, start_idx: int, end_idx: int) -> bool:
+    def _has_halt_bar(
+        df: pd.DataFrame, start_idx: int, end_idx: int, volumes: Optional[np.ndarray] = None
+    ) -> bool:
         """Check if any bar in [start_idx, end_idx] inclusive has zero volume (trading halt)."""
-        for i in range(start_idx, end_idx + 1):
-            if df.iloc[i]["volume"] <= 0:
-                return True
-        return False
+        if volumes is None:
+            volumes = df["volume"].to_numpy()
+        return bool((volumes[start_idx:end_idx + 1] <= 0).any())
 
     @staticmethod
     def _bar_time(df: pd.DataFrame, idx: int) -> str:
@@ -275,6 +590,7 @@ class PatternDetector(ABC):
         current_time: Optional[datetime] = None,
         details: Optional[Dict[str, Any]] = None,
         vwap: Optional[pd.Series] = None,
+        macd: Optional[pd.DataFrame] = None,
     ) -> List[ExitSignal]:
         """
         Check for exit/invalidation signals after entry.
@@ -286,97 +602,224 @@ class PatternDetector(ABC):
             entry_idx: Index of the entry bar
             entry_price: Price at which position was entered
             stop_price: Stop loss price
-            direction: "long" or "short"
+            direction: "long" or "short" (or a Direction)
             current_time: Current bar time (for time-based exits)
             details: Pattern-specific details
             vwap: Optional VWAP series (same length as bars) for VWAP cross exit
+            macd: Optional precomputed MACD DataFrame (same length as bars,
+                'macd'/'signal' columns); computed from closes if omitted
 
         Returns:
             List of ExitSignal objects (empty if no exits triggered)
         """
-        signals = []
-        df = bars.copy().reset_index(drop=True)
-        n = len(df)
+        df = self._positional(bars)
+        if entry_idx >= len(df) - 1:
+            return []  # Need at least one bar after entry
+        direction = Direction.of(direction)
+
+        # Stop, rejection and reversal-tail checks only look at individual
+        # bars, so one kernel pass from the entry bar finds all three. The
+        # entry bar itself can violate the stop if it gaps or wicks through.
+        arrays = bar_arrays(df)
+        bar_exits = scan_bar_exits(
+            arrays.open, arrays.high, arrays.low, arrays.close,
+            entry_idx, float(entry_price), float(stop_price), direction is Direction.SHORT,
+        )
+        return self._collect_exit_signals(
+            df, arrays, bar_exits, entry_idx, stop_price, direction, vwap, macd
+        )
 
-        if entry_idx >= n - 1:
-            return signals  # Need at least one bar after entry
+    def check_exit_signals_batch(
+        self,
+        bars_list: List[pd.DataFrame],
+        entry_idxs: List[int],
+        entry_prices: List[float],
+        stop_prices: List[float],
+        directions: List[Union[str, Direction]],
+        vwaps: Optional[List[Optional[pd.Series]]] = None,
+        macds: Optional[List[Optional[pd.DataFrame]]] = None,
+    ) -> List[List[ExitSignal]]:
+        """
+        check_exit_signals() for many open positions at once.
+
+        The bar-local scans (stop, rejection, reversal tail) for all
+        symbols run in one parallel kernel over a packed copy of their
+        OHLC columns (multi-core when Numba is installed). MACD, VWAP and
+        volume checks then run per symbol as usual.
 
-        # Check bars from entry onwards (including entry bar for stop check)
-        # Entry bar itself can violate stop if it gaps down or wicks through
-        post_entry_with_entry = df.iloc[entry_idx:]
-        post_entry = df.iloc[entry_idx + 1:]
+        Args:
+            bars_list: One OHLCV DataFrame per position
+            entry_idxs, entry_prices, stop_prices, directions: Per-position
+                arguments, as for check_exit_signals()
+            vwaps: Optional per-position VWAP series (None entries allowed)
+            macds: Optional per-position precomputed MACD frames (None
+                entries are computed from the bars)
 
-        # 1. Stop hit check (direction-aware) - includes entry bar
-        stop_signal = self._check_stop_hit(post_entry_with_entry, stop_price, direction)
-        if stop_signal:
-            signals.append(stop_signal)
+        Returns:
+            One signal list per position, in input order
 
-        # 2. MACD crossover (direction-aware)
-        macd_signal = self._check_macd_cross(df, entry_idx, direction)
-        if macd_signal:
-            signals.append(macd_signal)
+        Raises:
+            ValueError: If the per-position sequences differ in length
+        """
+        count = len(bars_list)
+        if vwaps is None:
+            vwaps = [None] * count
+        if macds is None:
+            macds = [None] * count
+        lengths = {
+            "entry_idxs": len(entry_idxs),
+            "entry_prices": len(entry_prices),
+            "stop_prices": len(stop_prices),
+            "directions": len(directions),
+            "vwaps": len(vwaps),
+            "macds": len(macds),
+        }
+        mismatched = {name: n for name, n in lengths.items() if n != count}
+        if mismatched:
+            raise ValueError(
+                f"Per-position arguments must match len(bars_list)={count}: {mismatched}"
+            )
 
-        # 3. VWAP crossover (direction-aware)
-        if vwap is not None:
-            vwap_signal = self._check_vwap_cross(df, entry_idx, vwap, direction)
-            if vwap_signal:
-                signals.append(vwap_signal)
+        frames = [self._positional(bars) for bars in bars_list]
+        per_symbol = [bar_arrays(df) for df in frames]
+        offsets = np.zeros(count + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(df) for df in frames])
+        packed = [
+            as_kernel_array(
+                np.concatenate([arrays[col] for arrays in per_symbol]) if count else np.empty(0)
+            )
+            for col in range(4)
+        ]
+        bar_exits = scan_bar_exits_batch(
+            *packed,
+            offsets,
+            np.asarray(entry_idxs, dtype=np.int64),
+            np.asarray(entry_prices, dtype=np.float64),
+            np.asarray(stop_prices, dtype=np.float64),
+            np.array([Direction.of(d) is Direction.SHORT for d in directions], dtype=np.bool_),
+        )
 
-        # 4. Volume decline (weakness) - applies to both directions
-        vol_signal = self._check_volume_decline(df, entry_idx)
-        if vol_signal:
-            signals.append(vol_signal)
+        results = []
+        for k, df in enumerate(frames):
+            if entry_idxs[k] >= len(df) - 1:
+                results.append([])  # Need at least one bar after entry
+                continue
+            results.append(self._collect_exit_signals(
+                df, per_symbol[k], tuple(int(i) for i in bar_exits[k]),
+                entry_idxs[k], stop_prices[k], Direction.of(directions[k]), vwaps[k], macds[k],
+            ))
+        return results
 
-        # 5. Jackknife/Bottoming rejection (direction-aware)
-        rejection_signal = self._check_rejection(post_entry, direction)
-        if rejection_signal:
-            signals.append(rejection_signal)
+    @staticmethod
+    def _positional(bars: pd.DataFrame) -> pd.DataFrame:
+        """Return bars with a default 0..n-1 index (bar_idx values are positions).
 
-        # 6. Topping/Bottoming tail (direction-aware)
-        tail_signal = self._check_reversal_tail(post_entry, entry_price, direction)
-        if tail_signal:
-            signals.append(tail_signal)
+        Exit helpers only read, so the caller's frame is reused when it
+        already has that index. Otherwise only the index is replaced: the
+        column data is shared, never copied, however wide the frame.
+        """
+        if bars.index.equals(pd.RangeIndex(len(bars))):
+            return bars
+        positional = bars.copy(deep=False)
+        positional.index = pd.RangeIndex(len(bars))
+        return positional
 
-        return signals
+    def _collect_exit_signals(
+        self,
+        df: pd.DataFrame,
+        arrays: BarArrays,
+        bar_exits: Tuple[int, int, int],
+        entry_idx: int,
+        stop_price: float,
+        direction: Direction,
+        vwap: Optional[pd.Series],
+        macd: Optional[pd.DataFrame],
+    ) -> List[ExitSignal]:
+        """Build the ordered signal list from kernel positions plus the series checks."""
+        opens, highs, lows, closes, _ = arrays
+        stop_i, rejection_i, tail_i = bar_exits
+
+        # Fixed slot per exit kind (None = not triggered), in report order
+        candidates = (
+            # 1. Stop hit check (direction-aware) - includes entry bar
+            self._stop_signal(highs, lows, stop_i, stop_i, stop_price, direction)
+            if stop_i >= 0 else None,
+            # 2. MACD crossover (direction-aware)
+            self._check_macd_cross(df, entry_idx, direction, macd, arrays),
+            # 3. VWAP crossover (direction-aware)
+            self._check_vwap_cross(df, entry_idx, vwap, direction, arrays)
+            if vwap is not None else None,
+            # 4. Volume decline (weakness) - applies to both directions
+            self._check_volume_decline(df, entry_idx, arrays),
+            # 5. Jackknife/Bottoming rejection (direction-aware)
+            self._rejection_signal(highs, lows, closes, rejection_i, rejection_i, direction)
+            if rejection_i >= 0 else None,
+            # 6. Topping/Bottoming tail (direction-aware)
+            self._tail_signal(opens, highs, lows, closes, tail_i, tail_i, direction)
+            if tail_i >= 0 else None,
+        )
+        return [signal for signal in candidates if signal is not None]
 
     def _check_stop_hit(
-        self, post_entry: pd.DataFrame, stop_price: float, direction: str = "long"
+        self, post_entry: pd.DataFrame, stop_price: float,
+        direction: Union[str, Direction] = "long",
     ) -> Optional[ExitSignal]:
         """Check if price hit stop loss (direction-aware)."""
-        for idx, row in post_entry.iterrows():
-            if direction == "short":
-                # Shorts: stop hit when price goes UP through stop
-                if row["high"] >= stop_price:
-                    return ExitSignal(
-                        signal_type="stop_hit",
-                        triggered=True,
-                        reason=f"Stop loss hit: high {row['high']:.2f} >= stop {stop_price:.2f}",
-                        bar_idx=idx,
-                        price=stop_price,
-                    )
-            else:
-                # Longs: stop hit when price goes DOWN through stop
-                if row["low"] <= stop_price:
-                    return ExitSignal(
-                        signal_type="stop_hit",
-                        triggered=True,
-                        reason=f"Stop loss hit: low {row['low']:.2f} <= stop {stop_price:.2f}",
-                        bar_idx=idx,
-                        price=stop_price,
-                    )
-        return None
+        direction = Direction.of(direction)
+        highs = post_entry["high"].to_numpy()
+        lows = post_entry["low"].to_numpy()
+        # Shorts: stop hit when the high goes UP through stop
+        # Longs: stop hit when the low goes DOWN through stop
+        prices = highs if direction is Direction.SHORT else lows
+        hit = direction * (prices - stop_price) <= 0
+        if not hit.any():
+            return None
+        first = int(hit.argmax())
+        return self._stop_signal(highs, lows, first, post_entry.index[first], stop_price, direction)
+
+    @staticmethod
+    def _stop_signal(
+        highs: np.ndarray, lows: np.ndarray, i: int, bar_idx: Any,
+        stop_price: float, direction: Direction,
+    ) -> ExitSignal:
+        """Build the stop_hit signal for bar position i."""
+        if direction is Direction.SHORT:
+            reason = f"Stop loss hit: high {highs[i]:.2f} >= stop {stop_price:.2f}"
+        else:
+            reason = f"Stop loss hit: low {lows[i]:.2f} <= stop {stop_price:.2f}"
+        return ExitSignal(
+            signal_type="stop_hit",
+            triggered=True,
+            reason=reason,
+            bar_idx=bar_idx,
+            price=stop_price,
+        )
 
     def _check_macd_cross(
-        self, df: pd.DataFrame, entry_idx: int, direction: str = "long"
+        self,
+        df: pd.DataFrame,
+        entry_idx: int,
+        direction: Union[str, Direction] = "long",
+        macd: Optional[pd.DataFrame] = None,
+        arrays: Optional[BarArrays] = None,
     ) -> Optional[ExitSignal]:
         """Check for adverse MACD crossover with confirmation bars (direction-aware).
 
         Instead of exiting immediately on cross, wait for N consecutive bars
         where MACD remains in adverse territory. This filters false signals.
+
+        A caller-supplied MACD (e.g. the one already passed to detect()) is
+        used as-is when it covers every bar; otherwise it is computed here.
         """
-        macd = self.calculate_macd(df["close"])
-        if macd is None:
-            return None
+        # Scalar reads from arrays, not per-bar row Series
+        if macd is None or len(macd) != len(df):
+            lines = self._macd_arrays(df["close"])
+            if lines is None:
+                return None
+            macd_line, signal_line, _ = lines
+        else:
+            macd_line = macd["macd"].to_numpy()
+            signal_line = macd["signal"].to_numpy()
 
         # Get confirmation bars from config (default: 1 = immediate exit)
         confirmation_bars = self.config.get("macd_exit_confirmation_bars", 1)
@@ -388,30 +831,28 @@ class PatternDetector(ABC):
         cross_bar_idx = None  # Bar where initial cross occurred
         consecutive_adverse = 0  # Count of consecutive adverse bars
 
+        # Adverse = MACD below signal for longs, above signal for shorts;
+        # the direction's sign folds both into one comparison per bar
+        direction = Direction.of(direction)
+        sign = int(direction)
+
+        closes = df["close"].to_numpy() if arrays is None else arrays.close
+
         for i in range(entry_idx + 1, len(df)):
             if i < 1:
                 continue
 
-            curr_macd = macd.iloc[i]["macd"]
-            curr_signal = macd.iloc[i]["signal"]
-
-            if direction == "short":
-                # For shorts: bullish (MACD > signal) is adverse
-                is_adverse = curr_macd > curr_signal
-            else:
-                # For longs: bearish (MACD < signal) is adverse
-                is_adverse = curr_macd < curr_signal
+            curr_macd = macd_line[i]
+            curr_signal = signal_line[i]
+            is_adverse = sign * (curr_macd - curr_signal) < 0
 
             if is_adverse:
                 if cross_bar_idx is None:
                     # Check if this is a new cross (prev was not adverse)
                     if i > 0:
-                        prev_macd = macd.iloc[i - 1]["macd"]
-                        prev_signal = macd.iloc[i - 1]["signal"]
-                        if direction == "short":
-                            was_adverse = prev_macd > prev_signal
-                        else:
-                            was_adverse = prev_macd < prev_signal
+                        prev_macd = macd_line[i - 1]
+                        prev_signal = signal_line[i - 1]
+                        was_adverse = sign * (prev_macd - prev_signal) < 0
                         if not was_adverse:
                             # This is the cross bar
                             cross_bar_idx = i
@@ -422,7 +863,7 @@ class PatternDetector(ABC):
 
                 # Check if we have enough confirmation
                 if consecutive_adverse >= confirmation_bars:
-                    if direction == "short":
+                    if direction is Direction.SHORT:
                         reason = f"MACD crossed above signal line ({consecutive_adverse} bars confirmed)"
                     else:
                         reason = f"MACD crossed below signal line ({consecutive_adverse} bars confirmed)"
@@ -431,7 +872,7 @@ class PatternDetector(ABC):
                         triggered=True,
                         reason=reason,
                         bar_idx=i,
-                        price=df.iloc[i]["close"],
+                        price=closes[i],
                     )
             else:
                 # MACD recovered - reset counter
@@ -445,7 +886,8 @@ class PatternDetector(ABC):
         df: pd.DataFrame,
         entry_idx: int,
         vwap: pd.Series,
-        direction: str = "long",
+        direction: Union[str, Direction] = "long",
+        arrays: Optional[BarArrays] = None,
     ) -> Optional[ExitSignal]:
         """
         Check for adverse VWAP crossover with confirmation (direction-aware).
@@ -459,7 +901,8 @@ class PatternDetector(ABC):
             df: OHLCV DataFrame
             entry_idx: Index of entry bar
             vwap: VWAP series (must be same length as df)
-            direction: "long" or "short"
+            direction: "long" or "short" (or a Direction)
+            arrays: Columns already extracted by check_exit_signals
 
         Returns:
             ExitSignal if VWAP cross detected, None otherwise
@@ -474,33 +917,29 @@ class PatternDetector(ABC):
         if entry_idx >= len(df) - (confirmation_bars + 1):
             return None
 
-        # Reset VWAP index to match df
-        vwap = vwap.reset_index(drop=True)
+        # Positional arrays (VWAP is aligned to df by position, not label)
+        closes = df["close"].to_numpy() if arrays is None else arrays.close
+        vwap_vals = vwap.to_numpy()
 
         cross_bar_idx = None
         consecutive_adverse = 0
 
-        for i in range(entry_idx + 1, len(df)):
-            close = df.iloc[i]["close"]
-            vwap_val = vwap.iloc[i]
+        # Adverse = close below VWAP for longs, above VWAP for shorts
+        direction = Direction.of(direction)
+        sign = int(direction)
 
-            if direction == "short":
-                # For shorts: price above VWAP is adverse
-                is_adverse = close > vwap_val
-            else:
-                # For longs: price below VWAP is adverse
-                is_adverse = close < vwap_val
+        for i in range(entry_idx + 1, len(df)):
+            close = closes[i]
+            vwap_val = vwap_vals[i]
+            is_adverse = sign * (close - vwap_val) < 0
 
             if is_adverse:
                 if cross_bar_idx is None:
                     # Check if this is a new cross
                     if i > entry_idx:
-                        prev_close = df.iloc[i - 1]["close"]
-                        prev_vwap = vwap.iloc[i - 1]
-                        if direction == "short":
-                            was_adverse = prev_close > prev_vwap
-                        else:
-                            was_adverse = prev_close < prev_vwap
+                        prev_close = closes[i - 1]
+                        prev_vwap = vwap_vals[i - 1]
+                        was_adverse = sign * (prev_close - prev_vwap) < 0
                         if not was_adverse:
                             # This is the cross bar
                             cross_bar_idx = i
@@ -513,7 +952,7 @@ class PatternDetector(ABC):
 
                 # Check if we have enough confirmation
                 if consecutive_adverse >= confirmation_bars:
-                    if direction == "short":
+                    if direction is Direction.SHORT:
                         reason = f"VWAP cross: price {close:.2f} above VWAP {vwap_val:.2f} ({consecutive_adverse} bars)"
                     else:
                         reason = f"VWAP cross: price {close:.2f} below VWAP {vwap_val:.2f} ({consecutive_adverse} bars)"
@@ -532,7 +971,7 @@ class PatternDetector(ABC):
         return None
 
     def _check_volume_decline(
-        self, df: pd.DataFrame, entry_idx: int
+        self, df: pd.DataFrame, entry_idx: int, arrays: Optional[BarArrays] = None
     ) -> Optional[ExitSignal]:
         """
         Check for significant volume decline after entry.
@@ -541,25 +980,30 @@ class PatternDetector(ABC):
         Requires BOTH volume decline AND price stalling to avoid
         exiting positions that are still running on lighter volume.
         """
-        if entry_idx >= len(df) - 3:
+        n = len(df)
+        if entry_idx >= n - 3:
             return None  # Need at least 3 bars after entry
 
-        entry_volume = df.iloc[entry_idx]["volume"]
-        post_entry = df.iloc[entry_idx + 1:]
-
-        if len(post_entry) < 3:
-            return None
+        # Last 3 bars are all post-entry (checked above), so plain tail
+        # indexing on the arrays replaces the tail(3)/mean() frame slices
+        if arrays is None:
+            arrays = bar_arrays(df)
+        vols = arrays.volume
+        entry_volume = vols[entry_idx]
 
         # Check if last 3 bars have declining volume < 50% of entry
-        recent_bars = post_entry.tail(3)
-        recent_avg_vol = recent_bars["volume"].mean()
+        # (NaN volumes skipped and all-NaN gives NaN, as Series.mean())
+        recent = vols[-3:]
+        recent = recent[~np.isnan(recent)]
+        recent_avg_vol = recent.sum() / recent.size if recent.size else np.nan
 
         if recent_avg_vol >= entry_volume * 0.5:
             return None
 
         # Volume is low — only exit if price is also stalling/declining
         # (don't exit if price is still making new highs on lighter volume)
-        price_stalling = recent_bars.iloc[-1]["close"] <= recent_bars.iloc[0]["open"]
+        last_close = arrays.close[-1]
+        price_stalling = last_close <= arrays.open[-3]
 
         if price_stalling:
             return ExitSignal(
@@ -569,13 +1013,13 @@ class PatternDetector(ABC):
                     f"Volume declining: {recent_avg_vol:.0f} < 50% of entry vol "
                     f"{entry_volume:.0f}, price stalling"
                 ),
-                bar_idx=len(df) - 1,
-                price=df.iloc[-1]["close"],
+                bar_idx=n - 1,
+                price=last_close,
             )
         return None
 
     def _check_rejection(
-        self, post_entry: pd.DataFrame, direction: str = "long"
+        self, post_entry: pd.DataFrame, direction: Union[str, Direction] = "long"
     ) -> Optional[ExitSignal]:
         """
         Check for rejection pattern (direction-aware).
@@ -589,48 +1033,38 @@ class PatternDetector(ABC):
         if len(post_entry) < 2:
             return None
 
-        for i in range(1, len(post_entry)):
-            curr = post_entry.iloc[i]
-            prev = post_entry.iloc[i - 1]
-
-            if direction == "short":
-                # Bottoming rejection (adverse for shorts):
-                # 1. Current bar made a lower low (new low attempt)
-                # 2. Current bar closes above prior bar's high (sharp rejection)
-                # 3. Current bar is green (close > open)
-                made_new_low = curr["low"] < prev["low"]
-                closes_above_prior_high = curr["close"] > prev["high"]
-                is_green = curr["close"] > curr["open"]
+        direction = Direction.of(direction)
+        opens, highs, lows, closes, _ = bar_arrays(post_entry)
+        i = scan_rejection(opens, highs, lows, closes, direction is Direction.SHORT)
+        if i < 0:
+            return None
+        return self._rejection_signal(highs, lows, closes, i, post_entry.index[i], direction)
 
-                if made_new_low and closes_above_prior_high and is_green:
-                    return ExitSignal(
-                        signal_type="bottoming_rejection",
-                        triggered=True,
-                        reason=f"Bottoming rejection: new low {curr['low']:.2f} then closed above prior high {prev['high']:.2f}",
-                        bar_idx=post_entry.index[i],
-                        price=curr["close"],
-                    )
-            else:
-                # Jackknife rejection (adverse for longs):
-                # 1. Current bar made a higher high (new high attempt)
-                # 2. Current bar closes below prior bar's low (sharp rejection)
-                # 3. Current bar is red (close < open)
-                made_new_high = curr["high"] > prev["high"]
-                closes_below_prior_low = curr["close"] < prev["low"]
-                is_red = curr["close"] < curr["open"]
-
-                if made_new_high and closes_below_prior_low and is_red:
-                    return ExitSignal(
-                        signal_type="jackknife",
-                        triggered=True,
-                        reason=f"Jackknife rejection: new high {curr['high']:.2f} then closed below prior low {prev['low']:.2f}",
-                        bar_idx=post_entry.index[i],
-                        price=curr["close"],
-                    )
-        return None
+    @staticmethod
+    def _rejection_signal(
+        highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+        i: int, bar_idx: Any, direction: Direction,
+    ) -> ExitSignal:
+        """Build the jackknife/bottoming_rejection signal for bar position i."""
+        if direction is Direction.SHORT:
+            return ExitSignal(
+                signal_type="bottoming_rejection",
+                triggered=True,
+                reason=f"Bottoming rejection: new low {lows[i]:.2f} then closed above prior high {highs[i - 1]:.2f}",
+                bar_idx=bar_idx,
+                price=closes[i],
+            )
+        return ExitSignal(
+            signal_type="jackknife",
+            triggered=True,
+            reason=f"Jackknife rejection: new high {highs[i]:.2f} then closed below prior low {lows[i - 1]:.2f}",
+            bar_idx=bar_idx,
+            price=closes[i],
+        )
 
     def _check_reversal_tail(
-        self, post_entry: pd.DataFrame, entry_price: float, direction: str = "long"
+        self, post_entry: pd.DataFrame, entry_price: float,
+        direction: Union[str, Direction] = "long",
     ) -> Optional[ExitSignal]:
         """
         Check for reversal tail pattern (direction-aware).
@@ -646,67 +1080,40 @@ class PatternDetector(ABC):
         if len(post_entry) < 1:
             return None
 
-        for i in range(len(post_entry)):
-            bar = post_entry.iloc[i]
-
-            high = bar["high"]
-            low = bar["low"]
-            open_price = bar["open"]
-            close = bar["close"]
-
-            # Calculate body and wicks
-            body_top = max(open_price, close)
-            body_bottom = min(open_price, close)
-            body_size = body_top - body_bottom
-            upper_wick = high - body_top
-            lower_wick = body_bottom - low
-            candle_range = high - low
-
-            # Skip if no range (doji-like with no movement)
-            if candle_range < 0.01:
-                continue
-
-            # Skip if body is zero (use small threshold)
-            if body_size < 0.005:
-                body_size = 0.005  # Prevent division by zero
-
-            if direction == "short":
-                # Bottoming tail (adverse for shorts): long lower wick, body in upper third
-                lower_wick_ratio = lower_wick / body_size
-                body_position = (body_bottom - low) / candle_range  # 0 = body at bottom, 1 = body at top
-
-                is_bottoming_tail = (
-                    lower_wick_ratio >= 2.0 and      # Long lower wick
-                    body_position >= 0.67 and         # Body in upper third
-                    close < entry_price               # We're in profit (price below entry for shorts)
-                )
-
-                if is_bottoming_tail:
-                    return ExitSignal(
-                        signal_type="bottoming_tail",
-                        triggered=True,
-                        reason=f"Bottoming tail: lower wick {lower_wick:.2f} ({lower_wick_ratio:.1f}x body), rejection at {low:.2f}",
-                        bar_idx=post_entry.index[i],
-                        price=close,
-                    )
-            else:
-                # Topping tail (adverse for longs): long upper wick, body in lower third
-                upper_wick_ratio = upper_wick / body_size
-                body_position = (body_bottom - low) / candle_range
-
-                is_topping_tail = (
-                    upper_wick_ratio >= 2.0 and      # Long upper wick
-                    body_position <= 0.33 and         # Body in lower third
-                    close > entry_price               # We're in profit
-                )
-
-                if is_topping_tail:
-                    return ExitSignal(
-                        signal_type="topping_tail",
-                        triggered=True,
-                        reason=f"Topping tail: upper wick {upper_wick:.2f} ({upper_wick_ratio:.1f}x body), rejection at {high:.2f}",
-                        bar_idx=post_entry.index[i],
-                        price=close,
-                    )
+        direction = Direction.of(direction)
+        opens, highs, lows, closes, _ = bar_arrays(post_entry)
+        i = scan_reversal_tail(
+            opens, highs, lows, closes, float(entry_price), direction is Direction.SHORT
+        )
+        if i < 0:
+            return None
+        return self._tail_signal(opens, highs, lows, closes, i, post_entry.index[i], direction)
 
-        return None
+    @staticmethod
+    def _tail_signal(
+        opens: np.ndarray, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+        i: int, bar_idx: Any, direction: Direction,
+    ) -> ExitSignal:
+        """Build the topping/bottoming tail signal for bar position i."""
+        # Recompute wick metrics for the triggering bar only (for the reason text)
+        body_top = max(opens[i], closes[i])
+        body_bottom = min(opens[i], closes[i])
+        body_size = max(body_top - body_bottom, 0.005)
+
+        if direction is Direction.SHORT:
+            lower_wick = body_bottom - lows[i]
+            return ExitSignal(
+                signal_type="bottoming_tail",
+                triggered=True,
+                reason=f"Bottoming tail: lower wick {lower_wick:.2f} ({lower_wick / body_size:.1f}x body), rejection at {lows[i]:.2f}",
+                bar_idx=bar_idx,
+                price=closes[i],
+            )
+        upper_wick = highs[i] - body_top
+        return ExitSignal(
+            signal_type="topping_tail",
+            triggered=True,
+            reason=f"Topping tail: upper wick {upper_wick:.2f} ({upper_wick / body_size:.1f}x body), rejection at {highs[i]:.2f}",
+            bar_idx=bar_idx,
+            price=closes[i],
+        )
@@ -4,9 +4,12 @@ ATR (Average True Range) Indicator Module
 Measures market volatility using the True Range concept.
 """
 
+import numpy as np
 import pandas as pd
 from typing import Optional
 
+from .ema import _ewm_mean_array
+
 
 DEFAULT_PERIOD = 14
 
@@ -27,16 +30,26 @@ def true_range(data: pd.DataFrame) -> pd.Series:
     Returns:
         pd.Series: True Range values
     """
-    high = data["high"]
-    low = data["low"]
-    close = data["close"]
-    prev_close = close.shift(1)
+    tr = _true_range_array(
+        data["high"].to_numpy(dtype=np.float64),
+        data["low"].to_numpy(dtype=np.float64),
+        data["close"].to_numpy(dtype=np.float64),
+    )
+    return pd.Series(tr, index=data.index)
+
 
-    tr1 = high - low
-    tr2 = (high - prev_close).abs()
-    tr3 = (low - prev_close).abs()
+def _true_range_array(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """true_range() over float64 column arrays; returns a new array."""
+    prev_close = close[:-1]
 
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    # The first bar has no prior close, so its true range is high - low;
+    # every later bar pairs with the close one position back (no shift).
+    # fmax skips NaN like a row-wise max().
+    tr = high - low
+    tr[1:] = np.fmax(
+        np.fmax(tr[1:], np.abs(high[1:] - prev_close)),
+        np.abs(low[1:] - prev_close),
+    )
     return tr
 
 
@@ -56,12 +69,16 @@ def calculate_atr(
     Returns:
         pd.Series: ATR values (first `period` values will be NaN/warming up)
     """
-    tr = true_range(data)
+    tr = _true_range_array(
+        data["high"].to_numpy(dtype=np.float64),
+        data["low"].to_numpy(dtype=np.float64),
+        data["close"].to_numpy(dtype=np.float64),
+    )
 
-    # Wilder's smoothing: alpha = 1/period
-    atr = tr.ewm(alpha=1/period, adjust=False).mean()
+    # Wilder's smoothing: alpha = 1/period, wrapped as a Series only at the end
+    atr = _ewm_mean_array(tr, 1/period)
 
-    return atr
+    return pd.Series(atr, index=data.index)
 
 
 def get_current_atr(
@@ -78,17 +95,41 @@ def get_current_atr(
     Returns:
         float: Current ATR value, or None if insufficient data
     """
-    if len(data) < period + 1:
+    return _current_atr(
+        data["high"].to_numpy(dtype=np.float64),
+        data["low"].to_numpy(dtype=np.float64),
+        data["close"].to_numpy(dtype=np.float64),
+        period,
+    )
+
+
+def _current_atr(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int = DEFAULT_PERIOD,
+) -> Optional[float]:
+    """
+    get_current_atr() for callers that already hold the columns as arrays.
+
+    Args:
+        high, low, close: float64 price arrays (most recent bar last)
+        period: ATR period (default 14)
+
+    Returns:
+        float: Current ATR value, or None if insufficient data
+    """
+    if len(close) < period + 1:
         return None
 
-    atr = calculate_atr(data, period)
-    return atr.iloc[-1]
+    return _ewm_mean_array(_true_range_array(high, low, close), 1/period)[-1]
 
 
 def add_atr_to_dataframe(
     data: pd.DataFrame,
     period: int = DEFAULT_PERIOD,
     column_name: str = "atr",
+    inplace: bool = False,
 ) -> pd.DataFrame:
     """
     Add ATR column to DataFrame.
@@ -97,10 +138,11 @@ def add_atr_to_dataframe(
         data: OHLCV DataFrame
         period: ATR period (default 14)
         column_name: Name for the ATR column
+        inplace: Add the column to data itself instead of a copy
 
     Returns:
         pd.DataFrame: Original data with ATR column added
     """
-    result = data.copy()
+    result = data if inplace else data.copy()
     result[column_name] = calculate_atr(data, period)
     return result
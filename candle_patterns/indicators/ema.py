@@ -4,42 +4,74 @@ EMA Indicator Module
 Exponential Moving Average calculation for common periods (9, 20, 200).
 """
 
+import numpy as np
 import pandas as pd
 from typing import Union, List, Optional
 
+from .._kernels import as_kernel_array, ewma_adjust_false, ewma_adjust_false_multi, span_alpha
+from .._njit import HAS_NUMBA
+
 
 # Default EMA periods
 DEFAULT_PERIODS = [9, 20, 200]
 
 
 def calculate_ema(
-    data: Union[pd.Series, pd.DataFrame],
+    data: Union[pd.Series, pd.DataFrame, np.ndarray],
     period: int,
     column: str = "close"
-) -> pd.Series:
+) -> Union[pd.Series, np.ndarray]:
     """
     Calculate EMA for a given period.
 
     Args:
-        data: Price data (Series or DataFrame with 'close' column)
+        data: Price data (Series, DataFrame with 'close' column, or a
+            1-D array of prices)
         period: EMA period (e.g., 9, 20, 200)
         column: Column name if DataFrame provided
 
     Returns:
-        pd.Series: EMA values
+        pd.Series: EMA values (an ndarray when given an ndarray, with no
+        pandas objects built at all)
     """
+    if isinstance(data, np.ndarray):
+        return _ewm_mean_array(data, span_alpha(period))
+
     if isinstance(data, pd.DataFrame):
         prices = data[column]
     else:
         prices = data
 
-    return prices.ewm(span=period, adjust=False).mean()
+    return _ewm_mean(prices, span_alpha(period))
+
+
+def _ewm_mean(prices: pd.Series, alpha: float) -> pd.Series:
+    """
+    ``prices.ewm(alpha=alpha, adjust=False).mean()``, bit-for-bit.
+
+    With Numba installed this is one compiled pass over the raw array,
+    wrapped back into a Series only at the end. Without it, pandas' own
+    EWM loop is faster than the kernel run as plain Python, so it is used
+    directly.
+    """
+    if not HAS_NUMBA:
+        return prices.ewm(alpha=alpha, adjust=False).mean()
+    values = _ewm_mean_array(prices.to_numpy(dtype=np.float64), alpha)
+    return pd.Series(values, index=prices.index, name=prices.name)
+
+
+def _ewm_mean_array(values: np.ndarray, alpha: float) -> np.ndarray:
+    """_ewm_mean() for a plain array of prices; returns a new float64 array."""
+    if not HAS_NUMBA:
+        return pd.Series(values, dtype=np.float64).ewm(alpha=alpha, adjust=False).mean().to_numpy(copy=True)
+    return ewma_adjust_false(as_kernel_array(values), alpha)
 
 
 def calculate_all_emas(
     data: pd.DataFrame,
     periods: Optional[List[int]] = None,
-    column: str = "close"
+    column: str = "close",
+    inplace: bool = False,
 ) -> pd.DataFrame:
     """
     Calculate multiple EMAs and add them to DataFrame.
@@ -48,6 +80,7 @@ def calculate_all_emas(
         data: OHLCV DataFrame
         periods: List of periods (default: [9, 20, 200])
         column: Price column to use
+        inplace: Add the columns to data itself instead of a copy
 
     Returns:
         pd.DataFrame: Original data with EMA columns added
@@ -55,10 +88,18 @@ def calculate_all_emas(
     if periods is None:
         periods = DEFAULT_PERIODS
 
-    result = data.copy()
+    result = data if inplace else data.copy()
+
+    # One price array feeds every period; each column is assigned as an array
+    values = data[column].to_numpy(dtype=np.float64)
+    if HAS_NUMBA and len(periods) > 1:
+        alphas = np.array([span_alpha(period) for period in periods])
+        emas = ewma_adjust_false_multi(as_kernel_array(values), alphas)
+    else:
+        emas = [_ewm_mean_array(values, span_alpha(period)) for period in periods]
 
-    for period in periods:
-        result[f"ema_{period}"] = calculate_ema(data, period, column)
+    for period, ema in zip(periods, emas):
+        result[f"ema_{period}"] = ema
 
     return result
 
@@ -81,11 +122,13 @@ def price_above_ema(
     """
     ema_col = f"ema_{period}"
 
-    if ema_col not in data.columns:
-        data = calculate_all_emas(data, [period], column)
+    # Only the EMA itself is needed; no copy of the frame to hold it
+    if ema_col in data.columns:
+        ema = data[ema_col]
+    else:
+        ema = calculate_ema(data, period, column)
 
-    last_row = data.iloc[-1]
-    return last_row[column] > last_row[ema_col]
+    return data[column].to_numpy()[-1] > ema.to_numpy()[-1]
 
 
 def ema_slope(
@@ -106,11 +149,13 @@ def ema_slope(
     """
     ema_col = f"ema_{period}"
 
-    if ema_col not in data.columns:
-        data = calculate_all_emas(data, [period])
-
     if len(data) < lookback:
         return 0.0
 
-    recent = data[ema_col].iloc[-lookback:]
-    return (recent.iloc[-1] - recent.iloc[0]) / lookback
+    if ema_col in data.columns:
+        ema = data[ema_col]
+    else:
+        ema = calculate_ema(data, period)
+
+    recent = ema.to_numpy()[-lookback:]
+    return (recent[-1] - recent[0]) / lookback
@@ -4,8 +4,13 @@ MACD Indicator Module
 Moving Average Convergence Divergence (12, 26, 9 standard parameters).
 """
 
+import numpy as np
 import pandas as pd
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
+
+from .._kernels import as_kernel_array, macd_adjust_false, span_alpha
+from .._njit import HAS_NUMBA
+from .ema import _ewm_mean
 
 
 # Default MACD parameters (standard)
@@ -13,6 +18,16 @@ DEFAULT_FAST = 12
 DEFAULT_SLOW = 26
 DEFAULT_SIGNAL = 9
 
+# Recent MACD results as (params, closes, lines), newest last: the one MACD
+# cache behind the query helpers (macd_is_positive, macd_crossover,
+# macd_histogram_slope) and every detector. A pipeline asks for MACD of the
+# same closes, or a prefix of them, back to back; an exact array compare is
+# far cheaper than recomputing. Bounded; the least recently used entry
+# is dropped.
+# Cached lines are read-only.
+_MACD_CACHE: List[Tuple[Tuple[int, int, int], np.ndarray, Tuple[np.ndarray, ...]]] = []
+_MACD_CACHE_MAX = 8
+
 
 def calculate_macd(
     data: pd.DataFrame,
@@ -35,26 +50,76 @@ def calculate_macd(
         Tuple[pd.Series, pd.Series, pd.Series]: (macd_line, signal_line, histogram)
     """
     prices = data[column]
+    return tuple(
+        pd.Series(line, index=prices.index, name=prices.name)
+        for line in _macd_arrays(prices, fast, slow, signal)
+    )
 
-    # MACD Line = Fast EMA - Slow EMA
-    fast_ema = prices.ewm(span=fast, adjust=False).mean()
-    slow_ema = prices.ewm(span=slow, adjust=False).mean()
-    macd_line = fast_ema - slow_ema
 
-    # Signal Line = EMA of MACD Line
-    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+def _macd_arrays(
+    prices: pd.Series, fast: int, slow: int, signal: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (macd_line, signal_line, histogram) as arrays, equal to the pandas
+    ewm(adjust=False) formulation bit for bit.
+
+    With Numba installed both EMAs and the signal line advance together in
+    one compiled pass over the closes; otherwise pandas' ewm() runs each.
+    """
+    if HAS_NUMBA:
+        macd_line, signal_line = macd_adjust_false(
+            as_kernel_array(prices.to_numpy(dtype=np.float64)),
+            span_alpha(fast), span_alpha(slow), span_alpha(signal),
+        )
+    else:
+        # MACD Line = Fast EMA - Slow EMA
+        fast_ema = _ewm_mean(prices, span_alpha(fast))
+        slow_ema = _ewm_mean(prices, span_alpha(slow))
+        macd_series = fast_ema - slow_ema
+
+        # Signal Line = EMA of MACD Line
+        macd_line = macd_series.to_numpy()
+        signal_line = _ewm_mean(macd_series, span_alpha(signal)).to_numpy()
 
     # Histogram = MACD Line - Signal Line
-    histogram = macd_line - signal_line
+    return macd_line, signal_line, macd_line - signal_line
 
-    return macd_line, signal_line, histogram
+
+def _cached_macd_arrays(
+    prices: pd.Series, fast: int, slow: int, signal: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """_macd_arrays() through _MACD_CACHE.
+
+    Identical closes return the cached lines. Closes that are a prefix of a
+    cached history (detect_many windows) get a slice of it, which is the
+    exact answer because each EMA only looks back.
+    """
+    params = (fast, slow, signal)
+    values = prices.to_numpy(dtype=np.float64)
+    m = len(values)
+    for i in range(len(_MACD_CACHE) - 1, -1, -1):
+        cached_params, cached_values, lines = _MACD_CACHE[i]
+        if cached_params != params or len(cached_values) < m:
+            continue
+        if np.array_equal(cached_values[:m], values, equal_nan=True):
+            _MACD_CACHE.append(_MACD_CACHE.pop(i))  # Most recently used last
+            return lines if len(cached_values) == m else tuple(line[:m] for line in lines)
+
+    lines = _macd_arrays(prices, fast, slow, signal)
+    for line in lines:
+        line.flags.writeable = False
+    if len(_MACD_CACHE) >= _MACD_CACHE_MAX:
+        del _MACD_CACHE[0]
+    _MACD_CACHE.append((params, values.copy(), lines))
+    return lines
 
 
 def add_macd_to_dataframe(
     data: pd.DataFrame,
     fast: int = DEFAULT_FAST,
     slow: int = DEFAULT_SLOW,
-    signal: int = DEFAULT_SIGNAL
+    signal: int = DEFAULT_SIGNAL,
+    inplace: bool = False,
 ) -> pd.DataFrame:
     """
     Add MACD columns to DataFrame.
@@ -62,12 +127,13 @@ def add_macd_to_dataframe(
     Args:
         data: OHLCV DataFrame
         fast, slow, signal: MACD parameters
+        inplace: Add the columns to data itself instead of a copy
 
     Returns:
         pd.DataFrame: Original data with MACD columns added
     """
-    result = data.copy()
-    macd_line, signal_line, histogram = calculate_macd(data, fast, slow, signal)
+    result = data if inplace else data.copy()
+    macd_line, signal_line, histogram = _macd_arrays(data["close"], fast, slow, signal)
 
     result["macd"] = macd_line
     result["macd_signal"] = signal_line
@@ -97,8 +163,8 @@ def macd_is_positive(
     if len(data) < min_bars:
         return None
 
-    _, _, histogram = calculate_macd(data, fast, slow, signal)
-    return histogram.iloc[-1] > 0
+    _, _, histogram = _cached_macd_arrays(data["close"], fast, slow, signal)
+    return histogram[-1] > 0
 
 
 def macd_crossover(
@@ -122,11 +188,11 @@ def macd_crossover(
     if len(data) < min_bars:
         return None
 
-    macd_line, signal_line, _ = calculate_macd(data, fast, slow, signal)
+    macd_line, signal_line, _ = _cached_macd_arrays(data["close"], fast, slow, signal)
 
     # Current and previous positions
-    current_diff = macd_line.iloc[-1] - signal_line.iloc[-1]
-    prev_diff = macd_line.iloc[-2] - signal_line.iloc[-2]
+    current_diff = macd_line[-1] - signal_line[-1]
+    prev_diff = macd_line[-2] - signal_line[-2]
 
     if prev_diff <= 0 and current_diff > 0:
         return "bullish"
@@ -157,10 +223,10 @@ def macd_histogram_slope(
     if len(data) < min_bars:
         return None
 
-    _, _, histogram = calculate_macd(data, fast, slow, signal)
+    _, _, histogram = _cached_macd_arrays(data["close"], fast, slow, signal)
 
     if len(histogram) < lookback:
         return None
 
-    recent = histogram.iloc[-lookback:]
-    return (recent.iloc[-1] - recent.iloc[0]) / lookback
+    recent = histogram[-lookback:]
+    return (recent[-1] - recent[0]) / lookback
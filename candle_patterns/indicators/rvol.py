@@ -5,6 +5,7 @@ Time-of-Day RVOL calculation - compares current volume to same time
 historical average (premarket vs premarket, RTH vs RTH).
 """
 
+import numpy as np
 import pandas as pd
 from datetime import datetime, time
 from typing import Optional, Dict, Tuple
@@ -48,6 +49,37 @@ def is_regular_hours(timestamp: datetime) -> bool:
     return time(9, 30) <= t < time(16, 0)
 
 
+# Session bounds in minutes since midnight, matching is_premarket() and
+# is_regular_hours() (start inclusive, end exclusive)
+_SESSION_MINUTES = {
+    "premarket": (4 * 60, 9 * 60 + 30),
+    "regular": (9 * 60 + 30, 16 * 60),
+}
+
+
+def _as_datetime(timestamps: pd.Series) -> pd.Series:
+    """pd.to_datetime(timestamps), skipped when the column is already datetime64."""
+    if pd.api.types.is_datetime64_any_dtype(timestamps.dtype):
+        return timestamps
+    return pd.to_datetime(timestamps)
+
+
+def _minutes_of_day(timestamps: pd.Series) -> np.ndarray:
+    """Wall-clock minutes since midnight for a datetime Series, vectorized."""
+    return (timestamps.dt.hour * 60 + timestamps.dt.minute).to_numpy()
+
+
+def _session_mask(minutes: np.ndarray, session: str) -> np.ndarray:
+    """Vectorized is_premarket() ("premarket") or is_regular_hours() (otherwise)."""
+    start, end = _SESSION_MINUTES["premarket" if session == "premarket" else "regular"]
+    return (minutes >= start) & (minutes < end)
+
+
+def _bucket_label(bucket_start: int) -> str:
+    """get_time_bucket()'s "HH:MM" label for a bucket start in minutes."""
+    return f"{bucket_start // 60:02d}:{bucket_start % 60:02d}"
+
+
 def calculate_historical_volume_profile(
     historical_bars: pd.DataFrame,
     lookback_days: int = DEFAULT_LOOKBACK_DAYS,
@@ -66,37 +98,31 @@ def calculate_historical_volume_profile(
     Returns:
         dict: {time_bucket: avg_volume}
     """
-    df = historical_bars.copy()
-
-    if "timestamp" not in df.columns:
+    if "timestamp" not in historical_bars.columns:
         return {}
 
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df["date"] = df["timestamp"].dt.date
+    # Masks and keys over the source columns; historical_bars is never copied
+    timestamps = _as_datetime(historical_bars["timestamp"])
+    minutes = _minutes_of_day(timestamps)
 
     # Filter by session
-    if session == "premarket":
-        df = df[df["timestamp"].apply(is_premarket)]
-    else:
-        df = df[df["timestamp"].apply(is_regular_hours)]
+    in_session = _session_mask(minutes, session)
 
-    if len(df) == 0:
+    if not in_session.any():
         return {}
 
     # Get unique dates and limit to lookback
-    unique_dates = sorted(df["date"].unique(), reverse=True)
-    lookback_dates = unique_dates[:lookback_days]
-    df = df[df["date"].isin(lookback_dates)]
+    dates = timestamps.dt.normalize()[in_session]
+    lookback_dates = dates.drop_duplicates().sort_values(ascending=False)[:lookback_days]
+    keep = dates.isin(lookback_dates).to_numpy()
 
-    # Calculate time buckets
-    df["time_bucket"] = df["timestamp"].apply(
-        lambda x: get_time_bucket(x, bucket_minutes)
-    )
+    # Calculate time buckets (integer bucket starts; labelled once per bucket)
+    bucket_start = minutes[in_session][keep] // bucket_minutes * bucket_minutes
 
     # Average volume by bucket
-    avg_by_bucket = df.groupby("time_bucket")["volume"].mean().to_dict()
+    avg_by_bucket = historical_bars["volume"][in_session][keep].groupby(bucket_start).mean()
 
-    return avg_by_bucket
+    return {_bucket_label(int(start)): avg for start, avg in avg_by_bucket.items()}
 
 
 def calculate_rvol_tod(
@@ -121,7 +147,10 @@ def calculate_rvol_tod(
     """
     if current_time is None:
         if "timestamp" in current_bars.columns:
-            current_time = pd.to_datetime(current_bars["timestamp"].iloc[-1])
+            timestamps = current_bars["timestamp"]
+            current_time = timestamps.iloc[-1]
+            if not pd.api.types.is_datetime64_any_dtype(timestamps.dtype):
+                current_time = pd.to_datetime(current_time)
         else:
             current_time = datetime.now()
 
@@ -150,26 +179,18 @@ def calculate_rvol_tod(
         return 1.0, session
 
     # Sum today's volume up to current bucket
-    today_bars = current_bars.copy()
-    if "timestamp" in today_bars.columns:
-        today_bars["timestamp"] = pd.to_datetime(today_bars["timestamp"])
-
-        # Filter to same session
-        if session == "premarket":
-            today_bars = today_bars[today_bars["timestamp"].apply(is_premarket)]
-        else:
-            today_bars = today_bars[today_bars["timestamp"].apply(is_regular_hours)]
-
-        # Get volume up to current bucket
-        today_bars["time_bucket"] = today_bars["timestamp"].apply(
-            lambda x: get_time_bucket(x, bucket_minutes)
+    volumes = current_bars["volume"]
+    if "timestamp" in current_bars.columns:
+        # Filter to same session, then sum the bars in the current bucket
+        minutes = _minutes_of_day(_as_datetime(current_bars["timestamp"]))
+        current_start = (current_time.hour * 60 + current_time.minute) // bucket_minutes * bucket_minutes
+        in_bucket = _session_mask(minutes, session) & (
+            minutes // bucket_minutes * bucket_minutes == current_start
         )
-        bucket_volume = today_bars[
-            today_bars["time_bucket"] == current_bucket
-        ]["volume"].sum()
+        bucket_volume = volumes[in_bucket].sum()  # Series sum: NaN volumes are skipped
     else:
         # If no timestamp, use last bar's volume
-        bucket_volume = today_bars["volume"].iloc[-1]
+        bucket_volume = volumes.iloc[-1]
 
     rvol = bucket_volume / avg_volume
     return rvol, session
@@ -191,33 +212,25 @@ def calculate_cumulative_rvol(
     Returns:
         float: Cumulative RVOL ratio
     """
-    today = current_bars.copy()
-    hist = historical_bars.copy()
-
-    if "timestamp" not in today.columns:
+    if "timestamp" not in current_bars.columns:
         return 1.0
 
-    today["timestamp"] = pd.to_datetime(today["timestamp"])
-    hist["timestamp"] = pd.to_datetime(hist["timestamp"])
+    today_timestamps = _as_datetime(current_bars["timestamp"])
+    hist_timestamps = _as_datetime(historical_bars["timestamp"])
 
     # Filter by session
-    if session == "premarket":
-        session_filter = is_premarket
-    else:
-        session_filter = is_regular_hours
-
-    today_session = today[today["timestamp"].apply(session_filter)]
-    hist_session = hist[hist["timestamp"].apply(session_filter)]
+    today_mask = _session_mask(_minutes_of_day(today_timestamps), session)
+    hist_mask = _session_mask(_minutes_of_day(hist_timestamps), session)
 
-    if len(today_session) == 0:
+    if not today_mask.any():
         return 1.0
 
     # Today's total volume
-    today_volume = today_session["volume"].sum()
+    today_volume = current_bars["volume"][today_mask].sum()
 
     # Historical average daily volume for same session
-    hist_session["date"] = hist_session["timestamp"].dt.date
-    daily_volumes = hist_session.groupby("date")["volume"].sum()
+    hist_dates = hist_timestamps.dt.normalize()[hist_mask]
+    daily_volumes = historical_bars["volume"][hist_mask].groupby(hist_dates.to_numpy()).sum()
 
     if len(daily_volumes) == 0:
         return 1.0
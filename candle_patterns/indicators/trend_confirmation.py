@@ -20,9 +20,12 @@ Early Session (<4 bars):
 Uses simplified 2-bar check instead of skipping entirely.
 """
 
+import numpy as np
 import pandas as pd
 from typing import Tuple, Optional, Literal
 
+from .._kernels import bar_arrays
+
 
 def check_5min_trend_confirmation(
     bars_5min: pd.DataFrame,
@@ -47,20 +50,23 @@ def check_5min_trend_confirmation(
     if bars_5min is None or len(bars_5min) == 0:
         return True, "No bars available - skipping check"
 
-    # Early session fallback: use simplified 2-bar check
-    if len(bars_5min) < lookback_candles:
-        return _check_early_session_trend(bars_5min, direction)
+    opens, highs, lows, closes, _ = bar_arrays(bars_5min)
 
-    last_n = bars_5min.tail(lookback_candles)
+    # Early session fallback: use simplified 2-bar check
+    if len(closes) < lookback_candles:
+        return _check_early_session_trend(opens, highs, lows, closes, direction)
 
     if direction == "long":
-        return _check_long_trend(bars_5min, last_n, min_trend_candles, lookback_candles, max_wick_ratio)
+        return _check_long_trend(opens, highs, closes, min_trend_candles, lookback_candles, max_wick_ratio)
     else:
-        return _check_short_trend(bars_5min, last_n, min_trend_candles, lookback_candles, max_wick_ratio)
+        return _check_short_trend(opens, lows, closes, min_trend_candles, lookback_candles, max_wick_ratio)
 
 
 def _check_early_session_trend(
-    bars: pd.DataFrame,
+    opens: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
     direction: Literal["long", "short"],
 ) -> Tuple[bool, str]:
     """
@@ -71,38 +77,41 @@ def _check_early_session_trend(
     - Last bar in trend direction (green for long, red for short)
     - Current close making progress (above prior high for long, below prior low for short)
     """
-    if len(bars) < 2:
+    if len(closes) < 2:
         return True, "Only 1 bar - skipping early session check"
 
-    last_bar = bars.iloc[-1]
-    prior_bar = bars.iloc[-2]
+    last_open = opens[-1]
+    last_close = closes[-1]
 
     if direction == "long":
         # Last bar should be green
-        if last_bar['close'] <= last_bar['open']:
+        if last_close <= last_open:
             return False, f"Early session: last bar is red (need green for long)"
 
         # Close should be above prior bar's high
-        if last_bar['close'] <= prior_bar['high']:
-            return False, f"Early session: close ${last_bar['close']:.2f} <= prior high ${prior_bar['high']:.2f}"
+        prior_high = highs[-2]
+        if last_close <= prior_high:
+            return False, f"Early session: close ${last_close:.2f} <= prior high ${prior_high:.2f}"
 
         return True, "Early session trend confirmed (2-bar check)"
 
     else:  # short
         # Last bar should be red
-        if last_bar['close'] >= last_bar['open']:
+        if last_close >= last_open:
             return False, f"Early session: last bar is green (need red for short)"
 
         # Close should be below prior bar's low
-        if last_bar['close'] >= prior_bar['low']:
-            return False, f"Early session: close ${last_bar['close']:.2f} >= prior low ${prior_bar['low']:.2f}"
+        prior_low = lows[-2]
+        if last_close >= prior_low:
+            return False, f"Early session: close ${last_close:.2f} >= prior low ${prior_low:.2f}"
 
         return True, "Early session trend confirmed (2-bar check)"
 
 
 def _check_long_trend(
-    bars_5min: pd.DataFrame,
-    last_n: pd.DataFrame,
+    opens: np.ndarray,
+    highs: np.ndarray,
+    closes: np.ndarray,
     min_trend_candles: int,
     lookback_candles: int,
     max_wick_ratio: float,
@@ -110,25 +119,23 @@ def _check_long_trend(
     """Check trend confirmation for long entry."""
 
     # Condition 1: At least min_trend_candles are green
-    green_mask = last_n['close'] > last_n['open']
-    green_count = green_mask.sum()
+    green_count = int((closes[-lookback_candles:] > opens[-lookback_candles:]).sum())
 
     if green_count < min_trend_candles:
         return False, f"Weak trend: only {green_count}/{lookback_candles} green candles on 5-min"
 
     # Condition 2: Current close > high from 2-3 bars ago (shows breakout progress)
-    current_close = bars_5min['close'].iloc[-1]
-    high_2_bars_ago = bars_5min['high'].iloc[-3] if len(bars_5min) >= 3 else 0
-    high_3_bars_ago = bars_5min['high'].iloc[-4] if len(bars_5min) >= 4 else 0
+    current_close = closes[-1]
+    high_2_bars_ago = highs[-3] if len(highs) >= 3 else 0
+    high_3_bars_ago = highs[-4] if len(highs) >= 4 else 0
     reference_high = max(high_2_bars_ago, high_3_bars_ago)
 
     if current_close <= reference_high:
         return False, f"No breakout: close ${current_close:.2f} <= prior high ${reference_high:.2f}"
 
     # Condition 3: No huge upper rejection wick on latest candle
-    latest = bars_5min.iloc[-1]
-    body = abs(latest['close'] - latest['open'])
-    upper_wick = latest['high'] - max(latest['close'], latest['open'])
+    body = abs(current_close - opens[-1])
+    upper_wick = highs[-1] - max(current_close, opens[-1])
 
     if body > 0.001 and upper_wick > max_wick_ratio * body:
         return False, f"Rejection wick: upper wick ${upper_wick:.2f} > {max_wick_ratio}x body ${body:.2f}"
@@ -137,8 +144,9 @@ def _check_long_trend(
 
 
 def _check_short_trend(
-    bars_5min: pd.DataFrame,
-    last_n: pd.DataFrame,
+    opens: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
     min_trend_candles: int,
     lookback_candles: int,
     max_wick_ratio: float,
@@ -146,25 +154,23 @@ def _check_short_trend(
     """Check trend confirmation for short entry."""
 
     # Condition 1: At least min_trend_candles are red
-    red_mask = last_n['close'] < last_n['open']
-    red_count = red_mask.sum()
+    red_count = int((closes[-lookback_candles:] < opens[-lookback_candles:]).sum())
 
     if red_count < min_trend_candles:
         return False, f"Weak trend: only {red_count}/{lookback_candles} red candles on 5-min"
 
     # Condition 2: Current close < low from 2-3 bars ago (shows breakdown progress)
-    current_close = bars_5min['close'].iloc[-1]
-    low_2_bars_ago = bars_5min['low'].iloc[-3] if len(bars_5min) >= 3 else float('inf')
-    low_3_bars_ago = bars_5min['low'].iloc[-4] if len(bars_5min) >= 4 else float('inf')
+    current_close = closes[-1]
+    low_2_bars_ago = lows[-3] if len(lows) >= 3 else float('inf')
+    low_3_bars_ago = lows[-4] if len(lows) >= 4 else float('inf')
     reference_low = min(low_2_bars_ago, low_3_bars_ago)
 
     if current_close >= reference_low:
         return False, f"No breakdown: close ${current_close:.2f} >= prior low ${reference_low:.2f}"
 
     # Condition 3: No huge lower rejection wick on latest candle
-    latest = bars_5min.iloc[-1]
-    body = abs(latest['close'] - latest['open'])
-    lower_wick = min(latest['close'], latest['open']) - latest['low']
+    body = abs(current_close - opens[-1])
+    lower_wick = min(current_close, opens[-1]) - lows[-1]
 
     if body > 0.001 and lower_wick > max_wick_ratio * body:
         return False, f"Rejection wick: lower wick ${lower_wick:.2f} > {max_wick_ratio}x body ${body:.2f}"
@@ -202,14 +208,15 @@ def check_momentum_deceleration(
     if bars is None or len(bars) < lookback:
         return False, f"Insufficient bars ({len(bars) if bars is not None else 0} < {lookback}) - blocking"
 
-    recent = bars.tail(lookback)
+    closes = bars["close"].to_numpy()[-lookback:]
+    volumes = bars["volume"].to_numpy()[-lookback:]
     mid = lookback // 2
 
     # --- Price ROC ---
-    first_half_start = recent.iloc[0]["close"]
-    first_half_end = recent.iloc[mid - 1]["close"]
-    second_half_start = recent.iloc[mid]["close"]
-    second_half_end = recent.iloc[-1]["close"]
+    first_half_start = closes[0]
+    first_half_end = closes[mid - 1]
+    second_half_start = closes[mid]
+    second_half_end = closes[-1]
 
     first_rate = (first_half_end - first_half_start) / first_half_start if first_half_start > 0 else 0
     second_rate = (second_half_end - second_half_start) / second_half_start if second_half_start > 0 else 0
@@ -220,8 +227,8 @@ def check_momentum_deceleration(
         return True, f"No upward momentum across window (full ROC: {full_roc:.4f})"
 
     # --- Volume trend ---
-    first_half_vol = recent.iloc[:mid]["volume"].mean()
-    second_half_vol = recent.iloc[mid:]["volume"].mean()
+    first_half_vol = volumes[:mid].mean()
+    second_half_vol = volumes[mid:].mean()
     vol_increasing = second_half_vol >= first_half_vol if first_half_vol > 0 else False
 
     # Layer 1: Absolute ROC floor — even if "decelerating", the second half
@@ -301,13 +308,14 @@ def count_consecutive_dojis(bars: pd.DataFrame, threshold: float = 0.2) -> int:
     Returns:
         int: Number of consecutive dojis at end
     """
-    count = 0
-    for i in range(len(bars) - 1, -1, -1):
-        if is_doji(bars.iloc[i], threshold):
-            count += 1
-        else:
-            break
-    return count
+    # is_doji() for every bar at once, then the run of dojis at the end
+    opens, highs, lows, closes, _ = bar_arrays(bars)
+    range_size = highs - lows
+    with np.errstate(divide='ignore', invalid='ignore'):
+        doji = (range_size < 0.001) | (np.abs(closes - opens) / range_size < threshold)
+
+    not_doji = np.flatnonzero(~doji)
+    return len(bars) - 1 - int(not_doji[-1]) if not_doji.size else len(bars)
 
 
 def check_candle_quality(
@@ -10,12 +10,19 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, time
 from typing import Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from .._kernels import as_kernel_array, session_vwap
+from .._njit import HAS_NUMBA
 
 
 # Default time boundaries
 PREMARKET_START = time(4, 0)
 REGULAR_START = time(9, 30)
 
+# Session times are Eastern wall-clock times
+_ET = ZoneInfo("America/New_York")
+
 
 def calculate_vwap(
     data: pd.DataFrame,
@@ -32,35 +39,84 @@ def calculate_vwap(
     Returns:
         pd.Series: VWAP values
     """
-    df = data.copy()
+    # Column arrays instead of a frame copy with helper columns
+    high, low, close = (data[col].to_numpy(dtype=np.float64) for col in ("high", "low", "close"))
+    volume = data["volume"].to_numpy()
+    index = data.index
 
     # Sort by timestamp to ensure correct cumulative calculation
     # (handles out-of-order bars from historical backfill + live updates)
-    if "timestamp" in df.columns:
-        df = df.sort_values("timestamp").reset_index(drop=True)
+    if "timestamp" in data.columns:
+        timestamps = data["timestamp"]
+        if not timestamps.is_monotonic_increasing:
+            order = timestamps.reset_index(drop=True).sort_values().index.to_numpy()
+            high, low, close, volume = high[order], low[order], close[order], volume[order]
+            timestamps = timestamps.iloc[order]
+        index = pd.RangeIndex(len(data))
 
     # Typical price = (H + L + C) / 3
-    df["typical_price"] = (df["high"] + df["low"] + df["close"]) / 3
-    df["tp_volume"] = df["typical_price"] * df["volume"]
+    typical_price = (high + low + close) / 3
+    tp_volume = typical_price * volume
+
+    if reset_time is not None and "timestamp" in data.columns:
+        # Bars at/after reset_time accumulate separately from those before
+        # it (across every day in the frame, as the session ids always did)
+        after_reset = _time_of_day_us(timestamps) >= _time_us(reset_time)
 
-    if reset_time is not None and "timestamp" in df.columns:
-        # Create session groups based on reset time
-        df["time_only"] = pd.to_datetime(df["timestamp"]).dt.time
-        df["session"] = (df["time_only"] >= reset_time).astype(int).diff().fillna(0).cumsum()
+        if HAS_NUMBA:
+            after_reset.flags.writeable = False
+            vwap = session_vwap(as_kernel_array(tp_volume), as_kernel_array(volume), after_reset)
+            return pd.Series(vwap, index=index)
 
         # Cumulative within each session
-        df["cum_tp_volume"] = df.groupby("session")["tp_volume"].cumsum()
-        df["cum_volume"] = df.groupby("session")["volume"].cumsum()
+        cum_tp_volume = pd.Series(tp_volume).groupby(after_reset).cumsum().to_numpy()
+        cum_volume = pd.Series(volume).groupby(after_reset).cumsum().to_numpy()
     else:
         # No reset - cumulative from start
-        df["cum_tp_volume"] = df["tp_volume"].cumsum()
-        df["cum_volume"] = df["volume"].cumsum()
+        cum_tp_volume = _nan_cumsum(tp_volume)
+        cum_volume = _nan_cumsum(volume)
 
     # VWAP = cumulative(TP * V) / cumulative(V)
-    vwap = df["cum_tp_volume"] / df["cum_volume"]
-    vwap = vwap.replace([np.inf, -np.inf], np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vwap = cum_tp_volume / cum_volume
+    vwap[np.isinf(vwap)] = np.nan
+
+    return pd.Series(vwap, index=index)
+
+
+def _nan_cumsum(values: np.ndarray) -> np.ndarray:
+    """Series.cumsum() over an array: NaNs stay NaN and are skipped in the sum."""
+    if values.dtype.kind != "f":
+        return np.cumsum(values)
+    values = values.copy()
+    missing = np.isnan(values)
+    if not missing.any():
+        return np.cumsum(values)
+    values[missing] = 0.0
+    result = np.cumsum(values)
+    result[missing] = np.nan
+    return result
 
-    return vwap
+
+def _time_us(t: time) -> int:
+    """Microseconds since midnight for a wall-clock time."""
+    return ((t.hour * 60 + t.minute) * 60 + t.second) * 1_000_000 + t.microsecond
+
+
+def _time_of_day_us(timestamps: pd.Series) -> np.ndarray:
+    """
+    _time_us() of every timestamp's ``.dt.time``, without building time objects.
+
+    Wall-clock time in the column's own timezone; NaT gets -1 so it never
+    compares at or after a reset time.
+    """
+    timestamps = pd.to_datetime(timestamps)
+    if timestamps.dt.tz is not None:
+        timestamps = timestamps.dt.tz_localize(None)
+    ns = timestamps.to_numpy(dtype="datetime64[ns]").view(np.int64)
+    tod = ns % 86_400_000_000_000 // 1000
+    tod[timestamps.isna().to_numpy()] = -1
+    return tod
 
 
 def calculate_premarket_vwap(
@@ -77,24 +133,23 @@ def calculate_premarket_vwap(
     Returns:
         pd.Series: Premarket VWAP values
     """
-    from zoneinfo import ZoneInfo
-
     # Filter to only premarket bars (4 AM to 9:30 AM ET)
     if "timestamp" in data.columns:
-        df = data.copy()
         # Convert to ET timezone for proper time comparison
-        timestamps = pd.to_datetime(df["timestamp"])
-        if timestamps.dt.tz is not None:
-            timestamps_et = timestamps.dt.tz_convert(ZoneInfo("America/New_York"))
+        timestamps = pd.to_datetime(data["timestamp"])
+        if timestamps.dt.tz is None:
+            timestamps_et = timestamps.dt.tz_localize("UTC").dt.tz_convert(_ET)
+        elif timestamps.dt.tz == _ET:
+            timestamps_et = timestamps
         else:
-            timestamps_et = timestamps.dt.tz_localize("UTC").dt.tz_convert(ZoneInfo("America/New_York"))
-        df["time_only_et"] = timestamps_et.dt.time
+            timestamps_et = timestamps.dt.tz_convert(_ET)
+        time_of_day = _time_of_day_us(timestamps_et)
 
         end = REGULAR_START
 
         # Keep only premarket bars for VWAP calculation
-        premarket_mask = (df["time_only_et"] >= premarket_start) & (df["time_only_et"] < end)
-        premarket_data = df[premarket_mask].copy()
+        premarket_mask = (time_of_day >= _time_us(premarket_start)) & (time_of_day < _time_us(end))
+        premarket_data = data[premarket_mask]
 
         if len(premarket_data) == 0:
             return pd.Series(index=data.index, dtype=float)
@@ -160,7 +215,9 @@ def get_current_vwap(
         vwap_type = "regular"
 
     # Get last valid value
-    last_valid = vwap_series.dropna().iloc[-1] if len(vwap_series.dropna()) > 0 else np.nan
+    values = vwap_series.to_numpy()
+    valid = np.flatnonzero(~np.isnan(values))
+    last_valid = values[valid[-1]] if valid.size else np.nan
 
     return last_valid, vwap_type
 
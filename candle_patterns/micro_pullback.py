@@ -25,9 +25,11 @@ Example:
 """
 
 from typing import Optional, Dict, Any
+import numpy as np
 import pandas as pd
+from ._kernels import bar_arrays, scan_surge_start
 from .base import PatternDetector, PatternResult
-from .indicators.atr import get_current_atr
+from .indicators.atr import _current_atr
 
 
 class MicroPullback(PatternDetector):
@@ -130,19 +132,19 @@ class MicroPullback(PatternDetector):
         except ValueError as e:
             return self.not_detected(str(e))
 
-        # Work with a copy to avoid modifying original
-        df = bars.copy().reset_index(drop=True)
+        df = self._positional(bars)  # read-only below, so no copy
         n = len(df)
 
         # Need at least 6 bars for pattern
         if n < 6:
             return self.not_detected(f"Insufficient bars: {n}")
 
-        # Mark green/red candles
-        df["is_green"] = df["close"] > df["open"]
+        # Mark green/red candles (array, not a column on the caller's frame)
+        arrays = bar_arrays(df)
+        is_green = self.is_green_arr(arrays.open, arrays.close)
 
         # Last bar should be green (potential entry candle)
-        if not df.iloc[-1]["is_green"]:
+        if not is_green[-1]:
             return self.not_detected("Last candle is red - waiting for green entry candle")
 
         # === FLEXIBLE APPROACH ===
@@ -150,11 +152,17 @@ class MicroPullback(PatternDetector):
         # Look for a zone where price pulled back from a recent high
 
         # Find the recent swing high (highest high in last 15 candles, excluding last 1)
+        # Window min/max below skip NaN like the Series reductions (fmin/fmax)
+        highs, lows = arrays.high, arrays.low
         lookback = min(15, n - 1)
-        recent_bars = df.iloc[-(lookback + 1):-1]  # Exclude entry candle
+        recent_start = n - 1 - lookback  # Exclude entry candle
 
-        swing_high_idx_relative = recent_bars["high"].idxmax()
-        swing_high = recent_bars.loc[swing_high_idx_relative, "high"]
+        recent_highs = highs[recent_start:n - 1]
+        if np.isnan(recent_highs).all():
+            return self.not_detected("No swing high found (no valid highs in lookback)")
+
+        swing_high_idx_relative = recent_start + int(np.nanargmax(recent_highs))
+        swing_high = highs[swing_high_idx_relative]
 
         # Pullback zone is between swing high and entry candle
         pullback_start_idx = swing_high_idx_relative + 1
@@ -166,8 +174,7 @@ class MicroPullback(PatternDetector):
         pullback_candle_count = pullback_end_idx - pullback_start_idx + 1
 
         # Calculate pullback depth first (needed for two-tier candle limit)
-        pullback_window = df.iloc[pullback_start_idx:pullback_end_idx + 1]
-        pullback_low = pullback_window["low"].min()
+        pullback_low = np.fmin.reduce(lows[pullback_start_idx:pullback_end_idx + 1])
         pullback_pct = abs(self.calculate_move_pct(swing_high, pullback_low))
 
         # Check pullback duration (simplified single limit)
@@ -185,27 +192,16 @@ class MicroPullback(PatternDetector):
         surge_end_idx = swing_high_idx_relative
         surge_start_idx = None
 
-        # Look back up to 10 bars for the surge start
-        for lookback_len in range(min_green_prior, min(11, surge_end_idx + 1)):
-            test_start = surge_end_idx - lookback_len + 1
-            if test_start < 0:
-                break
-
-            surge_window = df.iloc[test_start:surge_end_idx + 1]
-            surge_low = surge_window["low"].min()
-            surge_high = surge_window["high"].max()
-
-            # Calculate net move from low to high in window
-            net_move_pct = self.calculate_move_pct(surge_low, surge_high)
-
-            # Count mostly-green candles (allow some red)
-            green_count = surge_window["is_green"].sum()
-            green_ratio = green_count / len(surge_window)
-
-            # Accept if: net move >= min_prior_move AND mostly green (>50%)
-            if net_move_pct >= self.config["min_prior_move_pct"] and green_ratio >= 0.5:
-                surge_start_idx = test_start
-                break
+        # Look back up to 10 bars for the surge start: the shortest window
+        # ending at the swing high with a net move >= min_prior_move AND
+        # mostly green candles (>50%, some red allowed). Compiled scan.
+        start = scan_surge_start(
+            arrays.open, arrays.high, arrays.low, arrays.close,
+            surge_end_idx, max(min_green_prior, 1), min(10, surge_end_idx),
+            float(self.config["min_prior_move_pct"]),
+        )
+        if start >= 0:
+            surge_start_idx = start
 
         if surge_start_idx is None:
             return self.not_detected(
@@ -215,8 +211,8 @@ class MicroPullback(PatternDetector):
         # Reject wick-only surges where swing high bar close doesn't confirm the move
         tolerance = self.config.get("surge_close_confirmation_tolerance_pct")
         if tolerance is not None:
-            surge_start_close = df.iloc[surge_start_idx]["close"]
-            swing_high_close = df.iloc[swing_high_idx_relative]["close"]
+            surge_start_close = arrays.close[surge_start_idx]
+            swing_high_close = arrays.close[swing_high_idx_relative]
             close_change_pct = self.calculate_move_pct(surge_start_close, swing_high_close)
             if close_change_pct < -tolerance:
                 return self.not_detected(
@@ -226,13 +222,12 @@ class MicroPullback(PatternDetector):
                 )
 
         # Reject if any halt bar within pattern range (surge → entry)
-        if self._has_halt_bar(df, surge_start_idx, n - 1):
+        if self._has_halt_bar(df, surge_start_idx, n - 1, arrays.volume):
             return self.not_detected("Halt bar within pattern")
 
         # Step 3: Calculate actual surge metrics (pullback already calculated above)
-        surge_window = df.iloc[surge_start_idx:surge_end_idx + 1]
-        surge_low = surge_window["low"].min()
-        surge_high = surge_window["high"].max()
+        surge_low = np.fmin.reduce(lows[surge_start_idx:surge_end_idx + 1])
+        surge_high = np.fmax.reduce(highs[surge_start_idx:surge_end_idx + 1])
         prior_move_pct = self.calculate_move_pct(surge_low, surge_high)
 
         # Check max prior move (too extended for micro pullback)
@@ -242,8 +237,8 @@ class MicroPullback(PatternDetector):
                 f"Prior move too large: {prior_move_pct:.1f}% > {max_prior_move}%"
             )
 
-        # Get pullback high (pullback_window, pullback_low, pullback_pct already calculated above)
-        pullback_high = pullback_window["high"].max()
+        # Get pullback high (pullback_low, pullback_pct already calculated above)
+        pullback_high = np.fmax.reduce(highs[pullback_start_idx:pullback_end_idx + 1])
 
         # Check max pullback retrace (as fraction of the surge magnitude)
         surge_magnitude = swing_high - surge_low
@@ -267,7 +262,7 @@ class MicroPullback(PatternDetector):
         min_buffer_cents = stop_buffer_min_cents / 100
 
         # ATR-based floor: adapts to actual volatility
-        atr_value = get_current_atr(df, period=atr_period)
+        atr_value = _current_atr(arrays.high, arrays.low, arrays.close, atr_period)
         atr_buffer = (atr_value * atr_multiplier) if atr_value is not None else 0.0
 
         stop_buffer = max(pct_buffer, min_buffer_cents, atr_buffer)
@@ -278,24 +273,26 @@ class MicroPullback(PatternDetector):
         # (applied after Step 5 sets entry_price — see below)
 
         # Step 5: Entry trigger (no lookahead bias)
-        prev_bar = df.iloc[-2]  # Previous bar (complete)
-        entry_candle = df.iloc[-1]  # Current bar
+        # Scalar reads straight from the column arrays, not row Series
+        prev_bar_close = arrays.close[-2]  # Previous bar (complete)
+        entry_open = arrays.open[-1]  # Current bar
+        entry_close = arrays.close[-1]
         entry_mode = self.config.get("entry", "first_green_after_pullback")
 
         if entry_mode == "first_candle_new_high":
             # Conservative: require CONFIRMED break of swing high
             # Use previous bar's close or current bar's open (not current bar's high)
-            breakout_confirmed = (prev_bar["close"] > swing_high) or (entry_candle["open"] > swing_high)
+            breakout_confirmed = (prev_bar_close > swing_high) or (entry_open > swing_high)
             if not breakout_confirmed:
                 return self.not_detected(
-                    f"No confirmed new high: prev close {prev_bar['close']:.2f}, "
-                    f"curr open {entry_candle['open']:.2f} <= swing high {swing_high:.2f}"
+                    f"No confirmed new high: prev close {prev_bar_close:.2f}, "
+                    f"curr open {entry_open:.2f} <= swing high {swing_high:.2f}"
                 )
             entry_price = swing_high + 0.01
         else:
             # Ross's style: enter on first green after pullback
             # Entry at close + 1 cent — reflects realistic fill when signal fires at bar close
-            entry_price = entry_candle["close"] + 0.01
+            entry_price = entry_close + 0.01
 
         # Step 6: Validate entry price is reasonable
         # Check entry > stop (critical safety check)
@@ -306,7 +303,7 @@ class MicroPullback(PatternDetector):
 
         # Validate entry_price is within reasonable range of current price
         # This prevents stale bar data from causing invalid signals
-        current_price = entry_candle["close"]
+        current_price = entry_close
         max_entry_deviation_pct = self.config.get("max_entry_deviation_pct", 5.0)
         if entry_price > current_price * (1 + max_entry_deviation_pct / 100):
             return self.not_detected(
@@ -344,8 +341,8 @@ class MicroPullback(PatternDetector):
             )
 
         # Step 8: Volume profile gate — pullback must be lighter than surge
-        surge_volume = self._avg_volume(df, surge_start_idx, surge_end_idx)
-        pullback_volume = self._avg_volume(df, pullback_start_idx, pullback_end_idx)
+        surge_volume = self._avg_volume(df, surge_start_idx, surge_end_idx, arrays.volume)
+        pullback_volume = self._avg_volume(df, pullback_start_idx, pullback_end_idx, arrays.volume)
 
         max_vol_ratio = self.config.get("max_pullback_surge_volume_ratio", 0.75)
         if max_vol_ratio > 0 and surge_volume > 0:
@@ -358,9 +355,9 @@ class MicroPullback(PatternDetector):
 
         # Step 8b: Volume collapse ratio (peak-to-peak, not average)
         max_vcr = self.config.get("max_volume_collapse_ratio", 0.0)
-        peak_surge_vol = df.iloc[surge_start_idx:surge_end_idx + 1]["volume"].max()
+        peak_surge_vol = np.fmax.reduce(arrays.volume[surge_start_idx:surge_end_idx + 1])
         vcr_end = min(pullback_start_idx + 2, pullback_end_idx + 1)
-        peak_pullback_vol = df.iloc[pullback_start_idx:vcr_end]["volume"].max() if vcr_end > pullback_start_idx else 0
+        peak_pullback_vol = np.fmax.reduce(arrays.volume[pullback_start_idx:vcr_end]) if vcr_end > pullback_start_idx else 0
         volume_collapse_ratio = (peak_pullback_vol / peak_surge_vol) if peak_surge_vol > 0 else 0.0
 
         if 0 < max_vcr <= 1.0 and volume_collapse_ratio > max_vcr:
@@ -373,20 +370,20 @@ class MicroPullback(PatternDetector):
 
         # Step 9: Confirmations (advisory)
         above_vwap = None
-        if vwap is not None and len(vwap) == n:
-            above_vwap = entry_candle["close"] > vwap.iloc[-1]
+        vwap_arr = vwap.to_numpy() if vwap is not None and len(vwap) == n else None
+        if vwap_arr is not None:
+            above_vwap = entry_close > vwap_arr[-1]
 
         # Auto-calculate MACD if not provided
-        if macd is None:
-            macd = self.calculate_macd(df["close"])
+        macd_line, histogram = self._macd_lines(df["close"], macd)
 
         macd_positive = None
         macd_slope_up = None
-        if macd is not None and "histogram" in macd.columns and len(macd) == n:
-            macd_positive = macd.iloc[-1]["histogram"] > 0
+        if histogram is not None and len(histogram) == n:
+            macd_positive = histogram[-1] > 0
             # 3-bar MACD slope: compare current MACD line to 3 bars ago
-            if "macd" in macd.columns and len(macd) >= 4:
-                macd_slope_up = macd.iloc[-1]["macd"] > macd.iloc[-4]["macd"]
+            if macd_line is not None and len(macd_line) >= 4:
+                macd_slope_up = macd_line[-1] > macd_line[-4]
 
         # Step 10: Hard gates (reject pattern if not met)
         # Note: Use == False (not 'is False') because numpy.bool != Python bool
@@ -400,8 +397,8 @@ class MicroPullback(PatternDetector):
         # 0.1% of entry price so threshold scales with stock price.
         # $1 → 0.001, $10 → 0.01 (same as old default), $50 → 0.05
         min_histogram = max(entry_price * 0.001, 0.001)
-        if macd is not None and "histogram" in macd.columns:
-            current_histogram = macd.iloc[-1]["histogram"]
+        if histogram is not None:
+            current_histogram = histogram[-1]
             if current_histogram < min_histogram:
                 return self.not_detected(
                     f"HARD GATE: MACD histogram {current_histogram:.4f} below threshold {min_histogram}"
@@ -430,7 +427,7 @@ class MicroPullback(PatternDetector):
         if pullback_pct < 5.0:
             confidence += 0.06
 
-        green_count = surge_window["is_green"].sum()
+        green_count = is_green[surge_start_idx:surge_end_idx + 1].sum()
 
         # VWAP bounce observability metrics (log-only, for future pattern validation)
         vwap_rising_bars_10 = None
@@ -439,25 +436,22 @@ class MicroPullback(PatternDetector):
         price_vwap_gap_pct = None
         price_vwap_gap_pct_start = None
 
-        if vwap is not None and len(vwap) == n:
+        if vwap_arr is not None:
             lookback = min(10, n - 1)
             if lookback >= 10:
                 # Count strictly rising VWAP bars in last 10 (strict >, flat not counted)
-                vwap_tail = vwap.iloc[-(lookback + 1):]
-                vwap_rising_bars_10 = sum(
-                    1 for i in range(1, len(vwap_tail))
-                    if vwap_tail.iloc[i] > vwap_tail.iloc[i - 1]
-                )
+                vwap_tail = vwap_arr[-(lookback + 1):]
+                vwap_rising_bars_10 = int((vwap_tail[1:] > vwap_tail[:-1]).sum())
             # Price-VWAP gap at entry bar (denominator is close)
-            entry_vwap = vwap.iloc[-1]
+            entry_vwap = vwap_arr[-1]
             if entry_vwap > 0:
                 price_vwap_gap_pct = round(
-                    (entry_candle["close"] - entry_vwap) / entry_candle["close"] * 100, 2
+                    (entry_close - entry_vwap) / entry_close * 100, 2
                 )
             # Gap at start of VWAP lookback (for gap narrowing analysis)
             start_idx = max(0, n - 1 - lookback)
-            start_vwap = vwap.iloc[start_idx]
-            start_close = df.iloc[start_idx]["close"]
+            start_vwap = vwap_arr[start_idx]
+            start_close = arrays.close[start_idx]
             if start_vwap > 0 and start_close > 0:
                 price_vwap_gap_pct_start = round(
                     (start_close - start_vwap) / start_close * 100, 2
@@ -467,11 +461,10 @@ class MicroPullback(PatternDetector):
         min_pre_surge_bars = 3
         if surge_start_idx >= min_pre_surge_bars:
             pre_start = max(0, surge_start_idx - 10)
-            pre_surge_bars = df.iloc[pre_start:surge_start_idx]
-            consolidation_bar_count = len(pre_surge_bars)
-            range_high = pre_surge_bars["high"].max()
-            range_low = pre_surge_bars["low"].min()
-            avg_price = pre_surge_bars["close"].mean()
+            consolidation_bar_count = surge_start_idx - pre_start
+            range_high = np.fmax.reduce(highs[pre_start:surge_start_idx])
+            range_low = np.fmin.reduce(lows[pre_start:surge_start_idx])
+            avg_price = np.nanmean(arrays.close[pre_start:surge_start_idx])
             if avg_price > 0:
                 consolidation_range_pct = round(
                     (range_high - range_low) / avg_price * 100, 2
@@ -36,6 +36,7 @@ relies entirely on the news event + volume presence.
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 from zoneinfo import ZoneInfo
@@ -254,12 +255,7 @@ class NewsMomentum(PatternDetector):
 
     def _no(self, reason: str) -> PatternResult:
         """Shortcut for undetected result with a reason string."""
-        return PatternResult(
-            detected=False,
-            pattern_name="NewsMomentum",
-            confidence=0.0,
-            reason=reason,
-        )
+        return self.not_detected(reason)
 
     def _find_news_bar(self, bars: pd.DataFrame, news_time_et: datetime) -> Optional[int]:
         """Return the index of the bar whose minute matches news_time_et.
@@ -267,14 +263,26 @@ class NewsMomentum(PatternDetector):
         Assumes bars are 1-minute bars. The news bar is the bar with the same
         HH:MM ET timestamp as the news article. If bars are timestamped by
         open time (standard), the news bar is the one covering news_time_et.
+
+        When the bar timestamps are chronological (newest last) the minute
+        is located by binary search, so only O(log n) timestamps are
+        converted to ET. Out-of-order bars, or bars with no usable
+        timestamp, fall back to a linear scan.
         """
         news_minute = news_time_et.replace(second=0, microsecond=0)
+        i = None
+        if _timestamps_monotonic(bars):
+            try:
+                i = bisect_left(range(len(bars)), news_minute, key=lambda j: _bar_minute_et(bars, j))
+            except TypeError:  # a bar time is None — not orderable
+                i = None
+        if i is not None:
+            if i < len(bars) and _bar_minute_et(bars, i) == news_minute:
+                return i
+            return None
+
         for i in range(len(bars)):
-            bar_time = _extract_bar_time(bars, i)
-            if bar_time is None:
-                continue
-            bar_et = _to_et(bar_time).replace(second=0, microsecond=0)
-            if bar_et == news_minute:
+            if _bar_minute_et(bars, i) == news_minute:
                 return i
         return None
 
@@ -292,6 +300,27 @@ def _extract_bar_time(bars: pd.DataFrame, i: int) -> Optional[datetime]:
     return _bar_time(bars.iloc[i].name)
 
 
+def _timestamps_monotonic(bars: pd.DataFrame) -> bool:
+    """True if the bar timestamps (DatetimeIndex or 'timestamp' column) are
+    non-decreasing, i.e. safe to binary-search."""
+    if isinstance(bars.index, pd.DatetimeIndex):
+        return bars.index.is_monotonic_increasing
+    if "timestamp" in bars.columns:
+        try:
+            return bool(bars["timestamp"].is_monotonic_increasing)
+        except TypeError:  # mixed / unorderable timestamp types
+            return False
+    return False
+
+
+def _bar_minute_et(bars: pd.DataFrame, i: int) -> Optional[datetime]:
+    """ET timestamp of bar i truncated to the minute, or None if unavailable."""
+    bar_time = _extract_bar_time(bars, i)
+    if bar_time is None:
+        return None
+    return _to_et(bar_time).replace(second=0, microsecond=0)
+
+
 def _bar_time(ts: Any) -> Optional[datetime]:
     """Coerce various timestamp types to a timezone-aware datetime."""
     if ts is None:
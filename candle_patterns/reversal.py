@@ -22,7 +22,9 @@ to long-only trading - short functionality must be explicitly enabled.
 """
 
 from typing import Optional, Dict, Any
+import numpy as np
 import pandas as pd
+from ._kernels import bar_arrays
 from .base import PatternDetector, PatternResult
 
 
@@ -114,7 +116,7 @@ class ReversalPatternDetector(PatternDetector):
         except ValueError as e:
             return self.not_detected(str(e))
 
-        df = bars.copy().reset_index(drop=True)
+        df = self._positional(bars)  # read-only below, so no copy
         n = len(df)
 
         if n < self.config["min_bars_required"]:
@@ -122,8 +124,8 @@ class ReversalPatternDetector(PatternDetector):
 
         # Step 1: Check if stock is extended
         # Use prev_close if available; fall back to first bar's open
-        reference_price = prev_close if prev_close is not None else df.iloc[0]["open"]
-        current_price = df.iloc[-1]["close"]
+        reference_price = prev_close if prev_close is not None else df["open"].to_numpy()[0]
+        current_price = df["close"].to_numpy()[-1]
         intraday_low = df["low"].min()
         intraday_high = df["high"].max()
 
@@ -196,19 +198,19 @@ class ReversalPatternDetector(PatternDetector):
         - Best if at or near HOD
         """
         n = len(df)
-        bar = df.iloc[-1]
-        prev_bars = df.iloc[-4:-1] if n >= 4 else df.iloc[:-1]
+        arrays = bar_arrays(df)
+        prev_start = max(n - 4, 0)
 
         # Check for prior uptrend (3+ green bars)
-        green_count = sum(1 for _, row in prev_bars.iterrows() if row["close"] > row["open"])
+        green_count = int(self.is_green_arr(arrays.open[prev_start:-1], arrays.close[prev_start:-1]).sum())
         if green_count < 2:
             return self.not_detected("No prior uptrend for shooting star")
 
         # Calculate candle metrics
-        high = bar["high"]
-        low = bar["low"]
-        open_price = bar["open"]
-        close = bar["close"]
+        high = arrays.high[-1]
+        low = arrays.low[-1]
+        open_price = arrays.open[-1]
+        close = arrays.close[-1]
 
         body_top = max(open_price, close)
         body_bottom = min(open_price, close)
@@ -242,7 +244,7 @@ class ReversalPatternDetector(PatternDetector):
             return hod_fail
 
         # Volume gate
-        vol_passed, volume_ratio, avg_volume = self._check_reversal_volume(df, bar["volume"])
+        vol_passed, volume_ratio, avg_volume = self._check_reversal_volume(df, arrays.volume[-1])
         if not vol_passed:
             return self.not_detected(
                 f"ShootingStar volume too low: {volume_ratio:.2f}x avg < {self.config['min_volume_multiplier']}x"
@@ -250,7 +252,7 @@ class ReversalPatternDetector(PatternDetector):
 
         # Calculate entry/stop for short
         entry_price = close  # Enter on close of shooting star
-        pattern_high = bar["high"]
+        pattern_high = high
         stop_price = self._calculate_stop(df, "above", pattern_high=pattern_high)
         if stop_price <= entry_price:
             return self.not_detected(f"Invalid setup: stop ${stop_price:.2f} <= entry ${entry_price:.2f}")
@@ -550,10 +552,12 @@ class ReversalPatternDetector(PatternDetector):
         if avg_period < 5:
             return self.not_detected("Insufficient bars for volume average")
 
+        # Loop invariants: threshold lookup and volume column are read once
+        climax_multiplier = self.config["volume_climax_multiplier"]
+        volumes = df["volume"].to_numpy()
+
         # Calculate average volume (exclude last few bars and zero-volume halt bars)
-        base = df.iloc[:-3] if n > 5 else df
-        trading_bars = base[base["volume"] > 0]
-        avg_volume = trading_bars["volume"].mean() if len(trading_bars) > 0 else 0
+        avg_volume = self._avg_volume(df, 0, n - 4 if n > 5 else n - 1, volumes)
 
         # Check recent bars for volume climax
         for i in range(-3, 0):  # Check last 3 bars
@@ -561,13 +565,14 @@ class ReversalPatternDetector(PatternDetector):
             if bar_idx < 0:
                 continue
 
-            bar = df.iloc[i]
-            volume = bar["volume"]
+            volume = volumes[bar_idx]
             volume_ratio = volume / avg_volume if avg_volume > 0 else 0
 
-            if volume_ratio < self.config["volume_climax_multiplier"]:
+            if volume_ratio < climax_multiplier:
                 continue
 
+            bar = df.iloc[i]
+
             # Volume climax found - check for reversal confirmation
             # Either: bar is red, or has topping tail, or next bar is red
 
@@ -677,9 +682,8 @@ class ReversalPatternDetector(PatternDetector):
 
         Returns (passed, volume_ratio, avg_volume).
         """
-        base = df.iloc[:-3] if len(df) > 5 else df
-        trading_bars = base[base["volume"] > 0]
-        avg_volume = trading_bars["volume"].mean() if len(trading_bars) > 0 else 0
+        n = len(df)
+        avg_volume = self._avg_volume(df, 0, n - 4 if n > 5 else n - 1)
         volume_ratio = bar_volume / avg_volume if avg_volume > 0 else 0
         passed = volume_ratio >= self.config["min_volume_multiplier"]
         return passed, volume_ratio, avg_volume
@@ -694,9 +698,13 @@ class ReversalPatternDetector(PatternDetector):
         n = len(df)
         max_age = self.config.get("max_hod_age_bars", 10)
 
-        # Find where HOD occurred
-        hod = df["high"].max()
-        hod_idx = df["high"].idxmax()
+        # Find where HOD occurred (one scan gives both position and value;
+        # NaN highs are skipped, as Series.max()/idxmax() do)
+        highs = df["high"].to_numpy()
+        if np.isnan(highs).all():
+            return self.not_detected("No HOD found (no valid highs)"), None
+        hod_idx = int(np.nanargmax(highs))
+        hod = highs[hod_idx]
         bars_since_hod = n - 1 - hod_idx
 
         if bars_since_hod > max_age:
@@ -794,10 +802,9 @@ class ReversalPatternDetector(PatternDetector):
         # For shorts: MACD turning negative is good
         if macd is not None:
             macd_data = self.calculate_macd(df["close"]) if macd is None else macd
-            if macd_data is not None and len(macd_data) >= 2:
-                hist_curr = macd_data.iloc[-1].get("histogram", 0)
-                hist_prev = macd_data.iloc[-2].get("histogram", 0)
-                if hist_curr < hist_prev:  # MACD weakening
+            if macd_data is not None and len(macd_data) >= 2 and "histogram" in macd_data.columns:
+                histogram = macd_data["histogram"].to_numpy()
+                if histogram[-1] < histogram[-2]:  # MACD weakening
                     confidence += 0.06
 
         # Volume bonus
@@ -810,12 +817,11 @@ class ReversalPatternDetector(PatternDetector):
         """Check if current price is above VWAP."""
         if vwap is None or len(vwap) != len(df):
             return None
-        return df.iloc[-1]["close"] > vwap.iloc[-1]
+        return df["close"].to_numpy()[-1] > vwap.to_numpy()[-1]
 
     def _check_macd_positive(self, df: pd.DataFrame, macd: Optional[pd.DataFrame]) -> Optional[bool]:
         """Check if MACD histogram is positive."""
-        if macd is None:
-            macd = self.calculate_macd(df["close"])
-        if macd is None or "histogram" not in macd.columns:
+        _, histogram = self._macd_lines(df["close"], macd)
+        if histogram is None:
             return None
-        return macd.iloc[-1]["histogram"] > 0
+        return histogram[-1] > 0
@@ -0,0 +1,231 @@
+"""
+Incremental Indicator State
+===========================
+
+O(1)-per-bar EMA, MACD, ATR and VWAP updates for live monitoring, where
+bars arrive one at a time and recomputing the full history on every tick
+is wasted work.
+
+Each update is one ``_kernels._ewma_step`` (pandas'
+``ewm(span=..., adjust=False).mean()`` recursion), so feeding closes one by
+one gives the same values as PatternDetector.calculate_macd() over the
+whole series, and ATRState the same values as indicators.calculate_atr().
+VWAPState keeps the running sums behind indicators.calculate_vwap().
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, time
+from itertools import repeat
+from typing import Iterable, List, Optional, Tuple
+
+from ._kernels import span_alpha
+
+
+@dataclass(slots=True)
+class EMAState:
+    """Running EMA equivalent to ``ewm(span=span, adjust=False).mean()``."""
+    alpha: float
+    value: float = float("nan")
+    old_weight: float = 1.0  # Decays across NaN gaps, as in pandas
+
+    @classmethod
+    def from_span(cls, span: int) -> "EMAState":
+        """Create an EMA state using pandas' span -> alpha conversion."""
+        return cls(alpha=span_alpha(span))
+
+    def update(self, x: float) -> float:
+        """Fold in the next observation and return the new EMA value.
+
+        Inline copy of _kernels._ewma_step, which is the reference for the
+        update order (calling the compiled step per tick costs more than
+        the arithmetic); the two must stay in step.
+        """
+        is_observation = x == x
+        if self.value == self.value:
+            self.old_weight *= 1.0 - self.alpha
+            if is_observation:
+                if self.value != x:
+                    self.value = (self.old_weight * self.value + self.alpha * x) / (
+                        self.old_weight + self.alpha
+                    )
+                self.old_weight = 1.0
+        elif is_observation:
+            self.value = x
+        return self.value
+
+
+@dataclass(slots=True)
+class MACDState:
+    """
+    Running MACD (fast EMA - slow EMA, signal EMA of MACD).
+
+    Use from_closes() to seed from history, then update() once per new bar.
+    """
+    fast: EMAState = field(default_factory=lambda: EMAState.from_span(12))
+    slow: EMAState = field(default_factory=lambda: EMAState.from_span(26))
+    signal: EMAState = field(default_factory=lambda: EMAState.from_span(9))
+
+    @classmethod
+    def create(cls, fast: int = 12, slow: int = 26, signal: int = 9) -> "MACDState":
+        """Create an empty state for the given EMA periods."""
+        return cls(
+            fast=EMAState.from_span(fast),
+            slow=EMAState.from_span(slow),
+            signal=EMAState.from_span(signal),
+        )
+
+    @classmethod
+    def from_closes(
+        cls,
+        closes: Iterable[float],
+        fast: int = 12,
+        slow: int = 26,
+        signal: int = 9,
+    ) -> "MACDState":
+        """Create a state and replay historical closes through it."""
+        state = cls.create(fast, slow, signal)
+        for close in closes:
+            state.update(float(close))
+        return state
+
+    def update(self, close: float) -> Tuple[float, float, float]:
+        """
+        Fold in the next close.
+
+        Returns:
+            (macd, signal, histogram) for the new bar
+        """
+        macd = self.fast.update(close) - self.slow.update(close)
+        signal = self.signal.update(macd)
+        return macd, signal, macd - signal
+
+
+def _nan_max(a: float, b: float) -> float:
+    """max() that skips a NaN operand, like np.fmax."""
+    return a if a >= b or b != b else b
+
+
+@dataclass(slots=True)
+class ATRState:
+    """
+    Running ATR: Wilder-smoothed true range, as indicators.calculate_atr().
+
+    Use from_bars() to seed from history, then update() once per new bar.
+    """
+    true_range_ema: EMAState
+    prev_close: float = float("nan")  # None yet: first bar's range is high - low
+
+    @classmethod
+    def create(cls, period: int = 14) -> "ATRState":
+        """Create an empty state for the given ATR period."""
+        return cls(true_range_ema=EMAState(alpha=1 / period))
+
+    @classmethod
+    def from_bars(
+        cls,
+        highs: Iterable[float],
+        lows: Iterable[float],
+        closes: Iterable[float],
+        period: int = 14,
+    ) -> "ATRState":
+        """Create a state and replay historical bars through it."""
+        state = cls.create(period)
+        for high, low, close in zip(highs, lows, closes):
+            state.update(float(high), float(low), float(close))
+        return state
+
+    def update(self, high: float, low: float, close: float) -> float:
+        """Fold in the next bar and return the new ATR value."""
+        prev_close = self.prev_close
+        true_range = _nan_max(
+            _nan_max(high - low, abs(high - prev_close)), abs(low - prev_close)
+        )
+        self.prev_close = close
+        return self.true_range_ema.update(true_range)
+
+
+@dataclass(slots=True)
+class _RunningSum:
+    """Series.cumsum() one value at a time: NaNs return NaN and are skipped.
+
+    compensated=True follows the Kahan steps of pandas' groupby cumsum,
+    which calculate_vwap() uses when it resets by session.
+    """
+    compensated: bool
+    total: float = 0.0
+    compensation: float = 0.0
+
+    def add(self, x: float) -> float:
+        if x != x:
+            return x
+        if not self.compensated:
+            self.total += x
+            return self.total
+        y = x - self.compensation
+        t = self.total + y
+        self.compensation = t - self.total - y
+        self.total = t
+        return t
+
+
+@dataclass(slots=True)
+class VWAPState:
+    """
+    Running VWAP, as indicators.calculate_vwap(bars, reset_time).
+
+    With a reset_time, bars before and at/after that wall-clock time keep
+    separate sums, the same sessions calculate_vwap() uses. Bars must
+    arrive in timestamp order (calculate_vwap() sorts; this does not).
+    Use from_bars() to seed from history, then update() once per new bar.
+    """
+    reset_time: Optional[time] = None
+    sums: List[Tuple[_RunningSum, _RunningSum]] = field(init=False)  # (TP*V, V) per session
+
+    def __post_init__(self) -> None:
+        compensated = self.reset_time is not None
+        self.sums = [
+            (_RunningSum(compensated), _RunningSum(compensated))
+            for _ in range(2 if compensated else 1)
+        ]
+
+    @classmethod
+    def from_bars(
+        cls,
+        highs: Iterable[float],
+        lows: Iterable[float],
+        closes: Iterable[float],
+        volumes: Iterable[float],
+        timestamps: Optional[Iterable[datetime]] = None,
+        reset_time: Optional[time] = None,
+    ) -> "VWAPState":
+        """Create a state and replay historical bars through it."""
+        state = cls(reset_time=reset_time)
+        if timestamps is None:
+            timestamps = repeat(None)
+        for high, low, close, volume, timestamp in zip(highs, lows, closes, volumes, timestamps):
+            state.update(float(high), float(low), float(close), float(volume), timestamp)
+        return state
+
+    def update(
+        self,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        timestamp: Optional[datetime] = None,
+    ) -> float:
+        """Fold in the next bar and return the new VWAP value (NaN if undefined)."""
+        session = 0
+        if self.reset_time is not None:
+            if timestamp is None:
+                raise ValueError("timestamp is required when reset_time is set")
+            # NaT never counts as at/after the reset time
+            session = int(timestamp == timestamp and timestamp.time() >= self.reset_time)
+
+        tp_volume_sum, volume_sum = self.sums[session]
+        cum_tp_volume = tp_volume_sum.add((high + low + close) / 3 * volume)
+        cum_volume = volume_sum.add(volume)
+        if cum_volume == 0:
+            return float("nan")
+        vwap = cum_tp_volume / cum_volume
+        return float("nan") if vwap in (float("inf"), float("-inf")) else vwap
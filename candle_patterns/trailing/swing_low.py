@@ -44,8 +44,8 @@ def calculate(
     # Merge default params with config params
     params = {**DEFAULT_PARAMS, **config.params}
 
-    df = bars.copy().reset_index(drop=True)
-    n = len(df)
+    # Positional access only (iloc / tail ATR), so no copy or index reset needed
+    n = len(bars)
     entry_idx = state.entry_idx
 
     # Calculate risk (R)
@@ -75,7 +75,7 @@ def calculate(
         )
 
     # Get post-entry bars (excluding entry bar for trailing calc)
-    post_entry = df.iloc[entry_idx + 1:]
+    post_entry = bars.iloc[entry_idx + 1:]
 
     # Calculate high water mark and current R-multiple
     if state.direction == "long":
@@ -111,7 +111,7 @@ def calculate(
     # buffer = max(spread × multiplier, ATR × multiplier)
     spread_buffer = config.current_spread * params["spread_multiplier"]
 
-    atr_value = get_current_atr(df, period=params["atr_period"])
+    atr_value = get_current_atr(bars, period=params["atr_period"])
     if atr_value is not None:
         atr_buffer = atr_value * params["atr_multiplier"]
     else:
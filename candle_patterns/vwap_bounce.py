@@ -28,9 +28,11 @@ Example:
 """
 
 from typing import Optional, Dict, Any
+import numpy as np
 import pandas as pd
+from ._kernels import bar_arrays
 from .base import PatternDetector, PatternResult
-from .indicators.atr import get_current_atr
+from .indicators.atr import _current_atr
 
 
 class VwapBounce(PatternDetector):
@@ -78,6 +80,11 @@ class VwapBounce(PatternDetector):
             # MACD: boost only, not hard gate (VWAP slope is the momentum signal)
             "require_macd_positive": False,
 
+            # Reject below this confidence (0 = report every setup; the usual
+            # gate is applied downstream). Setups that can't reach it even
+            # with both MACD boosts skip the MACD calculation.
+            "min_confidence": 0.0,
+
             # Exit configuration (higher VWAP confirmation for near-VWAP entries)
             "macd_exit_confirmation_bars": 1,
             "vwap_exit_confirmation_bars": 3,
@@ -110,23 +117,29 @@ class VwapBounce(PatternDetector):
         except ValueError as e:
             return self.not_detected(str(e))
 
-        df = bars.copy().reset_index(drop=True)
+        df = self._positional(bars)  # read-only below, so no copy
         n = len(df)
 
         # Step 1: Require VWAP data (core signal, not optional)
         if vwap is None or len(vwap) != n:
             return self.not_detected("No VWAP data (required for VwapBounce)")
 
-        vwap = vwap.reset_index(drop=True)
-        valid_vwap_count = vwap.notna().sum()
+        # Everything below reads the shared column arrays
+        arrays = bar_arrays(df)
+        closes = arrays.close
+        vwap_arr = vwap.to_numpy(dtype=np.float64)
+        vwap_valid = ~np.isnan(vwap_arr)
+
+        valid_vwap_count = int(vwap_valid.sum())
         if valid_vwap_count < self.config["vwap_slope_lookback"] + self.config["min_consolidation_bars"]:
             return self.not_detected(
                 f"Insufficient VWAP data: {valid_vwap_count} valid bars"
             )
 
         # Step 2: Last bar must be green (entry trigger)
-        entry_candle = df.iloc[-1]
-        if entry_candle["close"] <= entry_candle["open"]:
+        entry_close = closes[-1]
+        entry_low = arrays.low[-1]
+        if entry_close <= arrays.open[-1]:
             return self.not_detected("Last candle is red — waiting for green entry candle")
 
         # Step 3: Check VWAP slope (strictly rising)
@@ -136,13 +149,9 @@ class VwapBounce(PatternDetector):
         if n < lookback + 1:
             return self.not_detected(f"Need {lookback + 1} bars for VWAP slope check")
 
-        vwap_tail = vwap.iloc[-(lookback + 1):]
-        rising_count = 0
-        for i in range(1, len(vwap_tail)):
-            v_curr = vwap_tail.iloc[i]
-            v_prev = vwap_tail.iloc[i - 1]
-            if pd.notna(v_curr) and pd.notna(v_prev) and v_curr > v_prev:
-                rising_count += 1
+        # NaN compares False, so gaps in VWAP never count as rising
+        vwap_tail = vwap_arr[-(lookback + 1):]
+        rising_count = int((vwap_tail[1:] > vwap_tail[:-1]).sum())
 
         if rising_count < min_rising:
             return self.not_detected(
@@ -162,15 +171,23 @@ class VwapBounce(PatternDetector):
         consol_low = None
         consol_range_pct = None
 
+        # Every candidate window ends at consol_end_idx, so the high/low of
+        # each length is a running max/min of the bars read backward: one
+        # pass instead of a max()/min() per window. fmax/fmin skip NaN the
+        # way Series.max()/min() do.
+        highs_back = np.fmax.accumulate(arrays.high[consol_end_idx::-1])
+        lows_back = np.fmin.accumulate(arrays.low[consol_end_idx::-1])
+
         # Try longest window first, shrink until range fits
         for length in range(min(max_consol, consol_end_idx + 1), min_consol - 1, -1):
             start = consol_end_idx - length + 1
             if start < 0:
                 continue
-            window = df.iloc[start:consol_end_idx + 1]
-            w_high = window["high"].max()
-            w_low = window["low"].min()
-            avg_price = window["close"].mean()
+            w_high = highs_back[length - 1]
+            w_low = lows_back[length - 1]
+            # Per-window mean keeps pandas' summation order (a running sum
+            # would round differently at the range_pct boundary)
+            avg_price = np.nanmean(closes[start:consol_end_idx + 1])
             if avg_price <= 0:
                 continue
             range_pct = (w_high - w_low) / avg_price * 100
@@ -193,16 +210,15 @@ class VwapBounce(PatternDetector):
 
         # Step 5: Check price-VWAP proximity during consolidation
         max_gap_pct = self.config["max_price_vwap_gap_pct"]
-        consol_closes = df.iloc[consol_start_idx:consol_end_idx + 1]["close"]
-        consol_vwaps = vwap.iloc[consol_start_idx:consol_end_idx + 1]
+        consol = slice(consol_start_idx, consol_end_idx + 1)
 
-        # Filter out NaN VWAP bars
-        valid_mask = consol_vwaps.notna()
+        # Filter out NaN VWAP bars (means skip NaN closes, like Series.mean())
+        valid_mask = vwap_valid[consol]
         if valid_mask.sum() < min_consol:
             return self.not_detected("Insufficient valid VWAP during consolidation")
 
-        avg_close = consol_closes[valid_mask].mean()
-        avg_vwap = consol_vwaps[valid_mask].mean()
+        avg_close = np.nanmean(closes[consol][valid_mask])
+        avg_vwap = vwap_arr[consol][valid_mask].mean()
         if avg_close <= 0:
             return self.not_detected("Invalid price data")
 
@@ -218,19 +234,17 @@ class VwapBounce(PatternDetector):
         gap_end_pct = None
         if self.config["require_gap_narrowing"] and consol_bars >= 4:
             mid = consol_start_idx + consol_bars // 2
-            first_half_closes = df.iloc[consol_start_idx:mid]["close"]
-            first_half_vwaps = vwap.iloc[consol_start_idx:mid]
-            second_half_closes = df.iloc[mid:consol_end_idx + 1]["close"]
-            second_half_vwaps = vwap.iloc[mid:consol_end_idx + 1]
+            first_half = slice(consol_start_idx, mid)
+            second_half = slice(mid, consol_end_idx + 1)
 
-            fh_valid = first_half_vwaps.notna()
-            sh_valid = second_half_vwaps.notna()
+            fh_valid = vwap_valid[first_half]
+            sh_valid = vwap_valid[second_half]
 
-            if fh_valid.sum() > 0 and sh_valid.sum() > 0:
-                fh_avg_close = first_half_closes[fh_valid].mean()
-                fh_avg_vwap = first_half_vwaps[fh_valid].mean()
-                sh_avg_close = second_half_closes[sh_valid].mean()
-                sh_avg_vwap = second_half_vwaps[sh_valid].mean()
+            if fh_valid.any() and sh_valid.any():
+                fh_avg_close = np.nanmean(closes[first_half][fh_valid])
+                fh_avg_vwap = vwap_arr[first_half][fh_valid].mean()
+                sh_avg_close = np.nanmean(closes[second_half][sh_valid])
+                sh_avg_vwap = vwap_arr[second_half][sh_valid].mean()
 
                 gap_start_pct = round(
                     abs(fh_avg_close - fh_avg_vwap) / fh_avg_close * 100, 2
@@ -253,26 +267,27 @@ class VwapBounce(PatternDetector):
             return self.not_detected("Zero consolidation range")
 
         entry_zone_ceiling = consol_low + consol_range * (entry_zone_pct / 100)
-        if entry_candle["low"] > entry_zone_ceiling:
+        if entry_low > entry_zone_ceiling:
             return self.not_detected(
-                f"Entry bar not near consolidation low: low ${entry_candle['low']:.2f} "
+                f"Entry bar not near consolidation low: low ${entry_low:.2f} "
                 f"> zone ceiling ${entry_zone_ceiling:.2f} "
                 f"(bottom {entry_zone_pct}% of ${consol_low:.2f}-${consol_high:.2f})"
             )
 
         # Step 8: No breakout yet (close must be below consolidation high)
-        if entry_candle["close"] >= consol_high:
+        if entry_close >= consol_high:
             return self.not_detected(
-                f"Already broke out: close ${entry_candle['close']:.2f} "
+                f"Already broke out: close ${entry_close:.2f} "
                 f">= consolidation high ${consol_high:.2f}"
             )
 
         # Step 9: Consolidation volume character
+        volumes = arrays.volume  # Also read by the halt check below
         volume_declining = None
         if consol_bars >= 4:
             mid = consol_start_idx + consol_bars // 2
-            first_half_vol = self._avg_volume(df, consol_start_idx, mid - 1)
-            second_half_vol = self._avg_volume(df, mid, consol_end_idx)
+            first_half_vol = self._avg_volume(df, consol_start_idx, mid - 1, volumes)
+            second_half_vol = self._avg_volume(df, mid, consol_end_idx, volumes)
             if first_half_vol > 0:
                 volume_declining = second_half_vol < first_half_vol
 
@@ -283,7 +298,7 @@ class VwapBounce(PatternDetector):
                 )
 
         # Step 10: Calculate stop price (below VWAP)
-        vwap_at_entry = vwap.iloc[-1]
+        vwap_at_entry = vwap_arr[-1]
         if pd.isna(vwap_at_entry) or vwap_at_entry <= 0:
             return self.not_detected("No valid VWAP at entry bar")
 
@@ -294,18 +309,18 @@ class VwapBounce(PatternDetector):
 
         pct_buffer = vwap_at_entry * (stop_buffer_pct / 100)
         min_buffer_cents = stop_buffer_min_cents / 100
-        atr_value = get_current_atr(df, period=atr_period)
+        atr_value = _current_atr(arrays.high, arrays.low, closes, atr_period)
         atr_buffer = (atr_value * atr_multiplier) if atr_value is not None else 0.0
 
         stop_buffer = max(pct_buffer, min_buffer_cents, atr_buffer)
         stop_price = vwap_at_entry - stop_buffer
 
         # Entry at close + 1 cent — reflects realistic fill when signal fires at bar close
-        entry_price = entry_candle["close"] + 0.01
+        entry_price = entry_close + 0.01
 
         # Step 11: Safety checks
         # Reject if any halt bar in pattern
-        if self._has_halt_bar(df, consol_start_idx, n - 1):
+        if self._has_halt_bar(df, consol_start_idx, n - 1, volumes):
             return self.not_detected("Halt bar within pattern")
 
         # Entry must be above stop
@@ -366,62 +381,54 @@ class VwapBounce(PatternDetector):
                         )
 
         # Step 12: MACD (confidence boost, not hard gate)
-        if macd is None:
-            macd = self.calculate_macd(df["close"])
+        min_confidence = self.config.get("min_confidence", 0.0)
+        if min_confidence > 0 and not self.config.get("require_macd_positive"):
+            best_case = self._confidence(
+                rising_count, gap_narrowing, True, True, consol_range_pct, volume_declining
+            )
+            if best_case < min_confidence:
+                return self.not_detected(
+                    f"Confidence {best_case:.2f} even with MACD < min {min_confidence:.2f}"
+                )
+
+        macd_line, histogram = self._macd_lines(df["close"], macd)
 
         macd_positive = None
         macd_slope_up = None
-        if macd is not None and "histogram" in macd.columns and len(macd) == n:
-            macd_positive = macd.iloc[-1]["histogram"] > 0
-            if "macd" in macd.columns and len(macd) >= 4:
-                macd_slope_up = macd.iloc[-1]["macd"] > macd.iloc[-4]["macd"]
+        if histogram is not None and len(histogram) == n:
+            macd_positive = histogram[-1] > 0
+            if macd_line is not None and len(macd_line) >= 4:
+                macd_slope_up = macd_line[-1] > macd_line[-4]
 
         if self.config.get("require_macd_positive") and macd_positive == False:
             return self.not_detected("HARD GATE: MACD histogram negative")
 
         # Step 13: Confidence scoring
-        confidence = 0.65
-
-        # Strong VWAP slope (8+ of 10 rising)
-        if rising_count >= 8:
-            confidence += 0.08
-
-        # Gap narrowing confirmed
-        if gap_narrowing:
-            confidence += 0.06
-
-        # MACD positive
-        if macd_positive:
-            confidence += 0.06
-
-        # MACD slope up
-        if macd_slope_up:
-            confidence += 0.04
-
-        # Tight consolidation (< 1% range)
-        if consol_range_pct is not None and consol_range_pct < 1.0:
-            confidence += 0.04
-
-        # Volume declining during consolidation
-        if volume_declining:
-            confidence += 0.03
+        confidence = self._confidence(
+            rising_count, gap_narrowing, macd_positive, macd_slope_up,
+            consol_range_pct, volume_declining,
+        )
+        if confidence < min_confidence:
+            return self.not_detected(
+                f"Confidence {confidence:.2f} < min {min_confidence:.2f}"
+            )
 
         # Price-VWAP gap at entry
         entry_vwap_gap_pct = round(
-            (entry_candle["close"] - vwap_at_entry) / entry_candle["close"] * 100, 2
-        ) if entry_candle["close"] > 0 else None
+            (entry_close - vwap_at_entry) / entry_close * 100, 2
+        ) if entry_close > 0 else None
 
         return PatternResult(
             detected=True,
             pattern_name="VwapBounce",
-            confidence=min(confidence, 0.90),
+            confidence=confidence,
             entry_price=entry_price,
             stop_price=stop_price,
             stop_distance_cents=stop_distance_cents,
             pattern_start_idx=consol_start_idx,
             pattern_end_idx=n - 1,
             candle_count=consol_bars + 1,  # consolidation + entry
-            above_vwap=entry_candle["close"] > vwap_at_entry if pd.notna(vwap_at_entry) else None,
+            above_vwap=entry_close > vwap_at_entry if pd.notna(vwap_at_entry) else None,
             macd_positive=macd_positive,
             macd_slope_up=macd_slope_up,
             volume_confirmation=volume_declining,
@@ -444,3 +451,41 @@ class VwapBounce(PatternDetector):
                 "stop_buffer": round(stop_buffer, 4),
             },
         )
+
+    @staticmethod
+    def _confidence(
+        rising_count: int,
+        gap_narrowing: Optional[bool],
+        macd_positive: Optional[bool],
+        macd_slope_up: Optional[bool],
+        consol_range_pct: Optional[float],
+        volume_declining: Optional[bool],
+    ) -> float:
+        """Confidence score from the confirmations, capped at 0.90."""
+        confidence = 0.65
+
+        # Strong VWAP slope (8+ of 10 rising)
+        if rising_count >= 8:
+            confidence += 0.08
+
+        # Gap narrowing confirmed
+        if gap_narrowing:
+            confidence += 0.06
+
+        # MACD positive
+        if macd_positive:
+            confidence += 0.06
+
+        # MACD slope up
+        if macd_slope_up:
+            confidence += 0.04
+
+        # Tight consolidation (< 1% range)
+        if consol_range_pct is not None and consol_range_pct < 1.0:
+            confidence += 0.04
+
+        # Volume declining during consolidation
+        if volume_declining:
+            confidence += 0.03
+
+        return min(confidence, 0.90)
@@ -0,0 +1,189 @@
+"""Tests for the EMA, MACD, ATR, VWAP and RVOL indicator functions."""
+from datetime import time
+
+import numpy as np
+import pandas as pd
+
+from candle_patterns import ATRState, VWAPState
+from candle_patterns.indicators import (
+    add_atr_to_dataframe,
+    add_macd_to_dataframe,
+    calculate_all_emas,
+    calculate_atr,
+    calculate_ema,
+    calculate_historical_volume_profile,
+    calculate_macd,
+    calculate_vwap,
+    ema_slope,
+    get_current_atr,
+    is_premarket,
+    is_regular_hours,
+    macd_crossover,
+    macd_histogram_slope,
+    macd_is_positive,
+    price_above_ema,
+    true_range,
+)
+from candle_patterns.indicators import macd as macd_module
+from candle_patterns.indicators.atr import _current_atr
+from candle_patterns.indicators.rvol import get_time_bucket
+
+
+def _closes(n=80, seed=0):
+    rng = np.random.default_rng(seed)
+    closes = pd.Series(10 + np.cumsum(rng.normal(0, 0.05, n)), name="close")
+    closes.iloc[5] = np.nan  # EWM must carry the weight across gaps like pandas
+    return closes
+
+
+class TestEMA:
+    def test_matches_pandas_ewm_exactly(self):
+        closes = _closes()
+        for period in (9, 20, 200):
+            expected = closes.ewm(span=period, adjust=False).mean()
+            pd.testing.assert_series_equal(calculate_ema(closes, period), expected, check_exact=True)
+
+    def test_keeps_index_and_accepts_frames(self):
+        closes = _closes(n=10)
+        closes.index = pd.date_range("2024-01-02 09:30", periods=10, freq="min")
+
+        ema = calculate_ema(pd.DataFrame({"close": closes}), 9)
+        assert ema.index.equals(closes.index)
+        assert calculate_ema(pd.Series([], dtype=float), 9).empty
+
+    def test_ndarray_input_returns_ndarray(self):
+        closes = _closes()
+        ema = calculate_ema(closes.to_numpy(), 9)
+
+        assert isinstance(ema, np.ndarray)
+        np.testing.assert_array_equal(ema, calculate_ema(closes, 9).to_numpy())
+
+    def test_all_emas_match_pandas_ewm_exactly(self):
+        closes = _closes()
+        result = calculate_all_emas(pd.DataFrame({"close": closes}))
+
+        for period in (9, 20, 200):
+            expected = closes.ewm(span=period, adjust=False).mean().to_numpy()
+            np.testing.assert_array_equal(result[f"ema_{period}"].to_numpy(), expected)
+
+    def test_single_ema_queries_match_frame_helpers(self):
+        bars = pd.DataFrame({"close": _closes().ffill()})
+        with_ema = calculate_all_emas(bars, [9])
+
+        assert "ema_9" not in bars.columns
+        assert price_above_ema(bars, 9) == price_above_ema(with_ema, 9)
+        assert ema_slope(bars, 9) == ema_slope(with_ema, 9)
+
+    def test_inplace_adds_columns_to_caller_frame(self):
+        closes = _closes().ffill()
+        bars = pd.DataFrame({"high": closes + 0.03, "low": closes - 0.02, "close": closes})
+        expected = add_atr_to_dataframe(add_macd_to_dataframe(calculate_all_emas(bars)))
+
+        result = calculate_all_emas(bars, inplace=True)
+        add_macd_to_dataframe(bars, inplace=True)
+        add_atr_to_dataframe(bars, inplace=True)
+        assert result is bars
+        pd.testing.assert_frame_equal(bars, expected)
+
+
+class TestMACD:
+    def test_matches_pandas_ewm_exactly(self):
+        closes = _closes()
+        macd_line, signal_line, histogram = calculate_macd(pd.DataFrame({"close": closes}))
+
+        expected_macd = (
+            closes.ewm(span=12, adjust=False).mean() - closes.ewm(span=26, adjust=False).mean()
+        )
+        expected_signal = expected_macd.ewm(span=9, adjust=False).mean()
+        pd.testing.assert_series_equal(macd_line, expected_macd, check_exact=True)
+        pd.testing.assert_series_equal(signal_line, expected_signal, check_exact=True)
+        pd.testing.assert_series_equal(histogram, expected_macd - expected_signal, check_exact=True)
+
+    def test_dataframe_columns_match_series(self):
+        bars = pd.DataFrame({"close": _closes()})
+        macd_line, signal_line, histogram = calculate_macd(bars)
+        result = add_macd_to_dataframe(bars)
+
+        np.testing.assert_array_equal(result["macd"].to_numpy(), macd_line.to_numpy())
+        np.testing.assert_array_equal(result["macd_signal"].to_numpy(), signal_line.to_numpy())
+        np.testing.assert_array_equal(result["macd_histogram"].to_numpy(), histogram.to_numpy())
+        assert "macd" not in bars.columns
+
+    def test_queries_share_one_computation(self):
+        bars = pd.DataFrame({"close": _closes().ffill()})
+        macd_line, signal_line, histogram = calculate_macd(bars)
+
+        assert macd_is_positive(bars) == (histogram.iloc[-1] > 0)
+        cached = macd_module._MACD_CACHE[-1][2]
+        assert macd_histogram_slope(bars) == (histogram.iloc[-1] - histogram.iloc[-3]) / 3
+        diff = macd_line - signal_line
+        assert macd_crossover(bars) == ("bullish" if diff.iloc[-2] <= 0 < diff.iloc[-1] else None)
+        assert macd_module._MACD_CACHE[-1][2] is cached
+        assert not cached[0].flags.writeable
+
+        changed = bars.copy()
+        changed.loc[changed.index[-1], "close"] += 1.0
+        assert macd_is_positive(changed) is not None
+        assert macd_module._MACD_CACHE[-1][2] is not cached
+
+
+class TestATR:
+    def test_matches_pandas_wilder_smoothing_exactly(self):
+        closes = _closes().ffill()
+        bars = pd.DataFrame({"high": closes + 0.03, "low": closes - 0.02, "close": closes})
+
+        expected = true_range(bars).ewm(alpha=1 / 14, adjust=False).mean()
+        pd.testing.assert_series_equal(calculate_atr(bars, 14), expected, check_exact=True)
+
+    def test_live_state_matches_full_recompute(self):
+        closes = _closes()
+        bars = pd.DataFrame({"high": closes + 0.03, "low": closes - 0.02, "close": closes})
+        expected = calculate_atr(bars, 14).to_numpy()
+
+        state = ATRState.from_bars(bars["high"][:20], bars["low"][:20], bars["close"][:20])
+        for i in range(20, len(bars)):
+            atr = state.update(bars["high"].iloc[i], bars["low"].iloc[i], bars["close"].iloc[i])
+            assert atr == expected[i]
+
+    def test_current_atr_from_arrays_matches_frame(self):
+        closes = _closes().ffill()
+        bars = pd.DataFrame({"high": closes + 0.03, "low": closes - 0.02, "close": closes})
+        arrays = [bars[col].to_numpy() for col in ("high", "low", "close")]
+
+        assert _current_atr(*arrays, 14) == get_current_atr(bars, 14) == calculate_atr(bars, 14).iloc[-1]
+        assert _current_atr(*(a[:14] for a in arrays), 14) is None
+
+
+class TestVWAP:
+    def test_live_state_matches_full_recompute(self):
+        closes = _closes().ffill()
+        timestamps = pd.Series(pd.date_range("2024-01-02 09:00", periods=len(closes), freq="min"))
+        volumes = pd.Series(np.random.default_rng(1).random(len(closes)) * 1000)
+        volumes.iloc[3] = np.nan
+        bars = pd.DataFrame({
+            "timestamp": timestamps, "high": closes + 0.03, "low": closes - 0.02,
+            "close": closes, "volume": volumes,
+        })
+
+        for reset_time in (None, time(9, 30)):
+            expected = calculate_vwap(bars, reset_time).to_numpy()
+            state = VWAPState(reset_time=reset_time)
+            live = [state.update(*bar) for bar in zip(bars["high"], bars["low"], bars["close"], volumes, timestamps)]
+            np.testing.assert_array_equal(live, expected)
+
+
+class TestRVOL:
+    def test_volume_profile_matches_per_bar_helpers(self):
+        timestamps = pd.Series(pd.to_datetime([
+            "2024-01-02 04:00:00", "2024-01-02 07:32:00", "2024-01-02 09:29:59",
+            "2024-01-02 09:30:00", "2024-01-03 07:34:00", "2024-01-03 15:59:00",
+        ]))
+        bars = pd.DataFrame({"timestamp": timestamps, "volume": [100, 200, 300, 400, 600, 500]})
+
+        for session, in_session in (("premarket", is_premarket), ("regular", is_regular_hours)):
+            expected = {}
+            for ts, volume in zip(timestamps, bars["volume"]):
+                if in_session(ts):
+                    expected.setdefault(get_time_bucket(ts), []).append(volume)
+            expected = {bucket: np.mean(vols) for bucket, vols in expected.items()}
+            assert calculate_historical_volume_profile(bars, session=session) == expected
@@ -17,6 +17,8 @@ Rules tested:
 Run with: pytest tests/test_micro_pullback.py -v
 """
 
+import numpy as np
+import pandas as pd
 import pytest
 from candle_patterns import MicroPullback
 from tests.fixtures.micro_pullback_fixtures import (
@@ -162,6 +164,16 @@ class TestMicroPullbackDetection:
         assert result.detected is False
         assert "red" in result.reason.lower()
 
+    def test_fail_all_nan_highs_in_lookback(self):
+        """Test rejection (not an error) when every high before the entry bar is NaN."""
+        bars = MP_PASS_VALID.copy()
+        bars.loc[bars.index[:-1], "high"] = np.nan
+
+        result = self.detector.detect(bars)
+
+        assert result.detected is False
+        assert "no swing high" in result.reason.lower()
+
     def test_fail_rr_too_low(self):
         """Test rejection when R:R is 1.9 (below 2.0 minimum)."""
         result = self.detector.detect(MP_FAIL_RR_TOO_LOW)
@@ -476,5 +488,78 @@ class TestMicroPullbackRetraceGate:
         assert 0.30 < r.details["pullback_retrace"] < 0.40
 
 
+class TestMicroPullbackInputFrame:
+    """detect() reads the caller's bars without copying or modifying them."""
+
+    def test_detect_leaves_bars_untouched(self):
+        bars = MP_PASS_VALID.reset_index(drop=True)
+        before = bars.copy()
+
+        assert MicroPullback().detect(bars).detected == MicroPullback().detect(MP_PASS_VALID).detected
+        pd.testing.assert_frame_equal(bars, before)
+
+    def test_wide_frame_columns_not_copied(self):
+        bars = MP_PASS_VALID.reset_index(drop=True)
+        wide = bars.assign(bid=bars["close"] - 0.01, ask=bars["close"] + 0.01)
+        wide.index = pd.date_range("2024-01-02 09:30", periods=len(wide), freq="min")
+
+        positional = MicroPullback()._positional(wide)
+        assert positional.index.equals(pd.RangeIndex(len(wide)))
+        assert np.shares_memory(positional["close"].to_numpy(), wide["close"].to_numpy())
+        assert isinstance(wide.index, pd.DatetimeIndex)
+        assert MicroPullback().detect(wide) == MicroPullback().detect(bars)
+
+
+class TestMicroPullbackBatch:
+    """Tests for PatternDetector.detect_batch()."""
+
+    def test_batch_matches_per_symbol_detect(self):
+        detector = MicroPullback()
+        bars_by_symbol = {
+            "PASS": MP_PASS_VALID,
+            "FAIL": MP_FAIL_LAST_BAR_RED,
+        }
+        results = detector.detect_batch(bars_by_symbol, max_workers=2)
+
+        assert list(results) == ["PASS", "FAIL"]
+        for symbol, bars in bars_by_symbol.items():
+            expected = detector.detect(bars)
+            assert results[symbol].detected == expected.detected
+            assert results[symbol].entry_price == expected.entry_price
+            assert results[symbol].stop_price == expected.stop_price
+            assert results[symbol].reason == expected.reason
+
+    def test_detect_many_matches_window_detect(self):
+        detector = MicroPullback()
+        bars = MP_PASS_VALID
+        ends = list(range(4, len(bars)))
+
+        results = detector.detect_many(bars, ends)
+
+        assert len(results) == len(ends)
+        assert results[-1].detected
+        for end, result in zip(ends, results):
+            assert result == MicroPullback().detect(bars.iloc[:end + 1])
+
+        frame = type(results[0]).to_frame(results, index=ends)
+        assert list(frame.index) == ends
+        assert frame["detected"].tolist() == [r.detected for r in results]
+
+    def test_batch_passes_per_symbol_vwap(self):
+        detector = MicroPullback()
+        high_vwap = pd.Series(MP_PASS_VALID["close"].max() * 2, index=MP_PASS_VALID.index)
+        bars_by_symbol = {"PLAIN": MP_PASS_VALID, "BELOW": MP_PASS_VALID}
+        vwap_by_symbol = {"BELOW": high_vwap}
+
+        for workers in (1, 2):
+            results = detector.detect_batch(
+                bars_by_symbol, max_workers=workers, vwap_by_symbol=vwap_by_symbol
+            )
+            assert results["PLAIN"].detected == detector.detect(MP_PASS_VALID).detected
+            expected = detector.detect(MP_PASS_VALID, vwap=high_vwap)
+            assert results["BELOW"].detected == expected.detected
+            assert results["BELOW"].reason == expected.reason
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -322,6 +322,25 @@ class TestNewsMomentumBarGate:
             or "news in the future" in reason
         )
 
+    def test_news_bar_found_with_timestamp_column(self):
+        """Monitor-style bars (RangeIndex + UTC timestamp column) locate the news bar."""
+        bars = _canon_bars(news_minute=5, symbol_price=10.00)
+        news_time = _news_time(bars, 5) + timedelta(seconds=30)
+        bars = bars.tz_convert("UTC").reset_index()
+        assert self.detector._find_news_bar(bars, news_time) == 5
+
+    def test_news_bar_found_in_out_of_order_bars(self):
+        """Shuffled bars can't be bisected; the linear scan still finds the news bar."""
+        bars = _canon_bars(news_minute=5, symbol_price=10.00)
+        news_time = _news_time(bars, 5)
+        shuffled = bars.iloc[[7, 5, 0, 8, 2, 6, 1, 4, 3]]
+        i = self.detector._find_news_bar(shuffled, news_time)
+        assert i is not None
+        assert shuffled.index[i] == bars.index[5]
+        assert self.detector._find_news_bar(
+            shuffled.tz_convert("UTC").reset_index(), news_time
+        ) == i
+
     def test_thin_news_bar_passes_when_check_disabled(self):
         """Default min_news_bar_volume=0 — a thin news bar (e.g. 400 shares
         from an initial news tick on an ILLQ stock) does NOT reject. The
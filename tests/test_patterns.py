@@ -14,8 +14,9 @@ Run with: pytest tests/test_patterns.py -v
 """
 
 import pytest
+import numpy as np
 import pandas as pd
-from candle_patterns import MicroPullback
+from candle_patterns import Direction, MicroPullback, NewsMomentum, PatternResult
 from tests.fixtures.exit_signal_fixtures import (
     # Topping Tail
     TOPPING_TAIL_VALID,
@@ -80,6 +81,208 @@ class TestPatternResult:
         assert result.detected is False
         assert "empty" in result.reason.lower()
 
+    def test_calc_risk_reward_batch_matches_scalar(self):
+        """Test that the batch R:R helper agrees with calc_risk_reward()."""
+        results = [
+            PatternResult(detected=True, pattern_name="A", confidence=0.7, entry_price=10.0, stop_price=9.5),
+            PatternResult(detected=True, pattern_name="B", confidence=0.7, entry_price=5.0, stop_price=5.0),
+            PatternResult(detected=False, pattern_name="C", confidence=0.0),
+        ]
+        targets = [11.0, 6.0, 1.0]
+        ratios = PatternResult.calc_risk_reward_batch(results, targets)
+
+        assert ratios[0] == results[0].calc_risk_reward(11.0) == 2.0
+        assert np.isnan(ratios[1]) and results[1].calc_risk_reward(6.0) is None
+        assert np.isnan(ratios[2]) and results[2].calc_risk_reward(1.0) is None
+
+    def test_not_detected_result_is_not_shared(self):
+        """Test that every rejection hands the caller its own result."""
+        first = MicroPullback().detect(pd.DataFrame())
+        second = MicroPullback().detect(pd.DataFrame())
+
+        assert first == second
+        assert first is not second
+        assert first.pattern_name == "MicroPullback"
+
+        first.reason = "mutated"
+        first.details = {"note": "caller-owned"}
+        third = MicroPullback().detect(pd.DataFrame())
+        assert third.reason == second.reason
+        assert third.details is None
+
+
+class TestDetectorConfig:
+    """Tests for per-instance detector config."""
+
+    def test_default_config_copies_are_independent(self):
+        """Test that cached defaults give each detector its own config."""
+        first = NewsMomentum()
+        first.config["min_confidence"] = 0.5
+        first.config["allowed_categories"].append("test_category")
+
+        second = NewsMomentum()
+        assert second.config == NewsMomentum().default_config()
+        assert "test_category" not in second.config["allowed_categories"]
+        assert NewsMomentum({"min_confidence": 0.9}).config["min_confidence"] == 0.9
+
+
+class TestCandleArrayHelpers:
+    """Tests for the vectorized candle helpers."""
+
+    def test_array_helpers_match_row_helpers(self):
+        """Test that the array helpers agree with the per-row helpers bar by bar."""
+        detector = MicroPullback()
+        bars = pd.DataFrame({
+            "open": [10.0, 10.5, 10.2, 10.2],
+            "high": [10.6, 10.7, 10.2, 10.9],
+            "low": [9.9, 10.1, 10.2, 10.0],
+            "close": [10.5, 10.2, 10.2, 10.8],
+        })
+        o, h, l, c = (bars[col].to_numpy() for col in ("open", "high", "low", "close"))
+
+        green = detector.is_green_arr(o, c)
+        red = detector.is_red_arr(o, c)
+        body_pct = detector.candle_body_pct_arr(o, h, l, c)
+        for i, row in bars.iterrows():
+            assert green[i] == detector.is_green_candle(row)
+            assert red[i] == detector.is_red_candle(row)
+            assert body_pct[i] == detector.candle_body_pct(row)
+        assert body_pct[2] == 0.0  # Zero-range bar
+
+    def test_move_pct_arr_matches_scalar(self):
+        """Test that calculate_move_pct_arr() agrees with calculate_move_pct(), 0 start included."""
+        detector = MicroPullback()
+        starts = np.array([10.0, 4.37, 0.0, 2.5])
+        ends = np.array([10.5, 4.11, 3.0, 2.5])
+
+        with np.errstate(all="raise"):
+            moves = detector.calculate_move_pct_arr(starts, ends)
+        for i in range(len(starts)):
+            assert moves[i] == detector.calculate_move_pct(starts[i], ends[i])
+        assert moves[2] == 0.0
+
+
+class TestToppingTailExit:
+    """Tests for topping tail exit signal detection."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.detector = MicroPullback()
+
+    def _get_tail_signal(self, fixture):
+        """Helper to check for topping tail signal."""
+        post_entry = fixture["bars"].iloc[1:]  # Skip entry bar
+        return self.detector._check_reversal_tail(post_entry, fixture["entry_price"])
+
+    def test_valid_topping_tail(self):
+        """Test that a long upper wick with low body in profit triggers."""
+        signal = self._get_tail_signal(TOPPING_TAIL_VALID)
+
+        assert signal is not None
+        assert signal.signal_type == "topping_tail"
+        assert signal.triggered is True
+        assert signal.bar_idx == 1
+
+    def test_wick_too_small(self):
+        """Test that a 1.5x upper wick does NOT trigger."""
+        assert self._get_tail_signal(TOPPING_TAIL_WICK_TOO_SMALL) is None
+
+    def test_body_not_in_lower_third(self):
+        """Test that a body above the lower third does NOT trigger."""
+        assert self._get_tail_signal(TOPPING_TAIL_BODY_NOT_LOW) is None
+
+    def test_not_in_profit(self):
+        """Test that a topping tail below entry does NOT trigger."""
+        assert self._get_tail_signal(TOPPING_TAIL_NOT_IN_PROFIT) is None
+
+    def test_limit_wick_ratio(self):
+        """Test that a wick just above 2x body triggers."""
+        signal = self._get_tail_signal(TOPPING_TAIL_LIMIT_WICK_RATIO)
+
+        assert signal is not None
+        assert signal.signal_type == "topping_tail"
+
+    def test_limit_body_position(self):
+        """Test that a body just inside the lower third triggers."""
+        signal = self._get_tail_signal(TOPPING_TAIL_LIMIT_BODY_POSITION)
+
+        assert signal is not None
+        assert signal.signal_type == "topping_tail"
+
+
+class TestJackknifeExit:
+    """Tests for jackknife rejection exit signal detection."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.detector = MicroPullback()
+
+    def _get_jackknife_signal(self, fixture):
+        """Helper to check for jackknife signal."""
+        post_entry = fixture["bars"].iloc[1:]  # Skip entry bar
+        return self.detector._check_rejection(post_entry)
+
+    def test_valid_jackknife(self):
+        """Test that new high + close below prior low + red triggers."""
+        signal = self._get_jackknife_signal(JACKKNIFE_VALID)
+
+        assert signal is not None
+        assert signal.signal_type == "jackknife"
+        assert signal.triggered is True
+        assert signal.bar_idx == 2
+
+    def test_not_enough_bars(self):
+        """Test that a single post-entry bar does NOT trigger."""
+        assert self._get_jackknife_signal(JACKKNIFE_NOT_ENOUGH_BARS) is None
+
+    def test_no_new_high(self):
+        """Test that no new high does NOT trigger."""
+        assert self._get_jackknife_signal(JACKKNIFE_NO_NEW_HIGH) is None
+
+    def test_close_above_prior_low(self):
+        """Test that closing above the prior low does NOT trigger."""
+        assert self._get_jackknife_signal(JACKKNIFE_ABOVE_PRIOR_LOW) is None
+
+    def test_green_candle(self):
+        """Test that a green candle does NOT trigger."""
+        assert self._get_jackknife_signal(JACKKNIFE_GREEN_CANDLE) is None
+
+    def test_limit_equal_high(self):
+        """Test that an equal high does NOT trigger (needs strictly higher)."""
+        assert self._get_jackknife_signal(JACKKNIFE_LIMIT_EQUAL_HIGH) is None
+
+    def test_limit_equal_low(self):
+        """Test that a close exactly at prior low does NOT trigger."""
+        assert self._get_jackknife_signal(JACKKNIFE_LIMIT_EQUAL_LOW) is None
+
+    def test_direction_enum_matches_string(self):
+        """Test that Direction members give the same signals as "long"/"short"."""
+        bars = STOP_HIT_SECOND_BAR["bars"]
+        for name, member in (("long", Direction.LONG), ("short", Direction.SHORT)):
+            stop = 9.50 if member is Direction.LONG else 10.15
+            assert self.detector.check_exit_signals(
+                bars, 0, 10.00, stop, direction=member
+            ) == self.detector.check_exit_signals(bars, 0, 10.00, stop, direction=name)
+
+    def test_direction_of_parses_strings(self):
+        """Test that Direction.of maps "short" to SHORT and anything else to LONG."""
+        assert Direction.of("short") == -1
+        assert Direction.of("anything") is Direction.LONG
+
+    def test_jackknife_in_check_exit_signals(self):
+        """Test that the single-pass exit scan reports the same jackknife bar."""
+        signals = self.detector.check_exit_signals(
+            bars=JACKKNIFE_VALID["bars"],
+            entry_idx=0,
+            entry_price=10.05,
+            stop_price=9.00,
+        )
+
+        jackknife = [s for s in signals if s.signal_type == "jackknife"]
+        assert len(jackknife) == 1
+        assert jackknife[0].bar_idx == 2
+        assert jackknife[0].reason == self._get_jackknife_signal(JACKKNIFE_VALID).reason
+
 
 class TestStopHitExit:
     """Tests for stop hit exit signal detection."""
@@ -130,6 +333,16 @@ class TestStopHitExit:
         assert signal is not None
         assert signal.signal_type == "stop_hit"
         assert signal.triggered is True
+        assert signal.bar_idx == 2
+
+    def test_short_stop_hit_reports_first_bar_through_stop(self):
+        """Test that short stops trigger on the first high at/above the stop."""
+        bars = STOP_HIT_SECOND_BAR["bars"]
+        signal = self.detector._check_stop_hit(bars, 10.15, direction="short")
+
+        assert signal is not None
+        assert signal.bar_idx == 1
+        assert "high 10.20 >= stop 10.15" in signal.reason
 
 
 class TestVolumDeclineExit:
@@ -153,6 +366,23 @@ class TestVolumDeclineExit:
         assert signal.signal_type == "volume_decline"
         assert signal.triggered is True
 
+    def test_nan_volume_in_trailing_window_is_skipped(self):
+        """Test that a missing volume bar doesn't fake a volume decline."""
+        # Price stalls after entry; volume stays at 90% of the entry bar
+        bars = pd.DataFrame({
+            "open": [10.0, 10.2, 10.2, 10.2],
+            "high": [10.3, 10.3, 10.3, 10.3],
+            "low": [9.9, 10.0, 10.0, 10.0],
+            "close": [10.2, 10.2, 10.2, 10.1],
+            "volume": [1000.0, 900.0, np.nan, 900.0],
+        })
+        assert self.detector._check_volume_decline(bars, 0) is None
+
+        # All-NaN window averages to NaN, as Series.mean() does
+        bars["volume"] = [1000.0, np.nan, np.nan, np.nan]
+        signal = self.detector._check_volume_decline(bars, 0)
+        assert signal is not None and "nan < 50%" in signal.reason
+
     def test_not_enough_bars_after_entry(self):
         """Test that signal is NOT triggered with < 3 bars after entry."""
         signal = self._get_volume_signal(VOLUME_DECLINE_NOT_ENOUGH_BARS)
@@ -239,6 +469,116 @@ class TestMACDCrossExit:
         assert signal.signal_type == "macd_cross"
         assert signal.triggered is True
 
+    def test_precomputed_macd_is_used(self):
+        """Test that a caller-supplied MACD frame drives the cross check."""
+        bars = MACD_CROSS_VALID["bars"]
+        entry_idx = MACD_CROSS_VALID["entry_idx"]
+        macd = self.detector.calculate_macd(bars["close"])
+
+        signal = self.detector._check_macd_cross(bars, entry_idx, macd=macd)
+        assert signal == self._get_macd_signal(MACD_CROSS_VALID)
+
+        # A flat, never-crossing MACD suppresses the exit
+        flat = macd.assign(macd=1.0, signal=0.0)
+        assert self.detector._check_macd_cross(bars, entry_idx, macd=flat) is None
+
+    def test_macd_matches_pandas_ewm_exactly(self):
+        """Test that the EWMA kernel reproduces pandas ewm(adjust=False) bit-for-bit."""
+        closes = MACD_CROSS_VALID["bars"]["close"]
+        macd = self.detector.calculate_macd(closes)
+
+        fast = closes.ewm(span=12, adjust=False).mean()
+        slow = closes.ewm(span=26, adjust=False).mean()
+        macd_line = fast - slow
+        signal_line = macd_line.ewm(span=9, adjust=False).mean()
+        pd.testing.assert_series_equal(macd["macd"], macd_line, check_exact=True, check_names=False)
+        pd.testing.assert_series_equal(macd["signal"], signal_line, check_exact=True, check_names=False)
+
+    def test_live_macd_matches_full_recompute(self):
+        """Test that per-bar update_macd() reproduces calculate_macd() exactly."""
+        closes = MACD_CROSS_VALID["bars"]["close"]
+        expected = self.detector.calculate_macd(closes)
+
+        self.detector.seed_macd(closes.iloc[:20])
+        for i in range(20, len(closes)):
+            macd, signal, histogram = self.detector.update_macd(closes.iloc[i])
+            assert macd == expected["macd"].iloc[i]
+            assert signal == expected["signal"].iloc[i]
+            assert histogram == expected["histogram"].iloc[i]
+
+    def test_exit_check_reads_macd_arrays_without_frame(self):
+        """Test that the exit check uses cached MACD arrays, matching calculate_macd()."""
+        closes = MACD_CROSS_VALID["bars"]["close"]
+        assert self._get_macd_signal(MACD_CROSS_VALID) is not None
+
+        macd_line, signal_line, histogram = self.detector._macd_arrays(closes)
+        frame = self.detector.calculate_macd(closes)
+        np.testing.assert_array_equal(frame["macd"].to_numpy(), macd_line)
+        np.testing.assert_array_equal(frame["signal"].to_numpy(), signal_line)
+        np.testing.assert_array_equal(frame["histogram"].to_numpy(), histogram)
+
+    def test_detector_macd_lines_skip_frame(self):
+        """Test that detect()'s MACD confirmations read arrays, matching a supplied frame."""
+        closes = MACD_CROSS_VALID["bars"]["close"]
+        macd_line, histogram = self.detector._macd_lines(closes)
+
+        frame = MicroPullback().calculate_macd(closes)
+        np.testing.assert_array_equal(self.detector._macd_lines(closes, frame)[0], macd_line)
+        np.testing.assert_array_equal(self.detector._macd_lines(closes, frame)[1], histogram)
+        assert self.detector._macd_lines(closes, frame[["macd"]])[1] is None
+        assert self.detector._macd_lines(closes.iloc[:5]) == (None, None)
+
+    def test_macd_prefix_served_from_longer_history(self):
+        """Test that MACD of a prefix of the cached closes is sliced, not recomputed."""
+        closes = MACD_CROSS_VALID["bars"]["close"]
+        full = self.detector._macd_arrays(closes)
+
+        prefix = self.detector._macd_arrays(closes.iloc[:20])
+        assert np.shares_memory(prefix[0], full[0])
+        expected = MicroPullback().calculate_macd(closes.iloc[:20])
+        pd.testing.assert_frame_equal(self.detector.calculate_macd(closes.iloc[:20]), expected)
+
+    def test_macd_shared_across_detectors(self):
+        """Test that a second detector reuses MACD lines computed by the first."""
+        closes = MACD_CROSS_VALID["bars"]["close"]
+        first = self.detector._macd_arrays(closes)
+        second = MicroPullback()._macd_arrays(closes.copy())
+
+        assert all(a is b for a, b in zip(first, second))
+        assert not first[0].flags.writeable
+        assert MicroPullback()._macd_arrays(closes, fast=6)[0] is not first[0]
+
+    def test_macd_cache_never_shared_across_periods(self):
+        """Test that detectors with different MACD periods get their own lines."""
+        closes = MACD_CROSS_VALID["bars"]["close"]
+        standard = MicroPullback()._macd_arrays(closes)
+        fast = MicroPullback()._macd_arrays(closes, fast=6, slow=13, signal=5)
+
+        assert not any(np.shares_memory(a, b) for a, b in zip(standard, fast))
+        expected = (closes.ewm(span=6, adjust=False).mean() - closes.ewm(span=13, adjust=False).mean()).to_numpy()
+        np.testing.assert_array_equal(fast[0], expected)
+        assert MicroPullback()._macd_arrays(closes)[0] is standard[0]
+
+    def test_macd_reused_for_identical_closes(self):
+        """Test that MACD is only recomputed when the closes change."""
+        closes = MACD_CROSS_VALID["bars"]["close"]
+        first = self.detector.calculate_macd(closes)
+
+        again = self.detector.calculate_macd(closes.copy())
+        assert again is not first
+        pd.testing.assert_frame_equal(again, first)
+
+        # Each call owns its frame: edits never reach later callers
+        again["extra"] = 1.0
+        again.loc[again.index[-1], "macd"] = 99.0
+        pd.testing.assert_frame_equal(self.detector.calculate_macd(closes), first)
+
+        changed = closes.copy()
+        changed.iloc[-1] += 0.01
+        recomputed = self.detector.calculate_macd(changed)
+        assert recomputed is not first
+        assert recomputed["macd"].iloc[-1] != first["macd"].iloc[-1]
+
 
 class TestVWAPCrossExit:
     """Tests for VWAP cross exit signal detection."""
@@ -275,6 +615,13 @@ class TestVWAPCrossExit:
 
         assert signal is None
 
+    def test_confirmation_bars_read_from_current_config(self):
+        """Test that a config change after construction applies to the next check."""
+        assert self._get_vwap_signal(VWAP_CROSS_VALID) is not None
+
+        self.detector.config["vwap_exit_confirmation_bars"] = len(VWAP_CROSS_VALID["bars"])
+        assert self._get_vwap_signal(VWAP_CROSS_VALID) is None
+
     def test_limit_equals_then_below(self):
         """Test that price equaling VWAP then going below triggers."""
         signal = self._get_vwap_signal(VWAP_CROSS_LIMIT_EQUALS_THEN_BELOW)
@@ -313,5 +660,53 @@ class TestVWAPCrossExit:
         assert vwap_signals[0].triggered is True
 
 
+class TestBatchExitSignals:
+    """Tests for check_exit_signals_batch()."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.detector = MicroPullback()
+
+    def test_batch_matches_single_calls(self):
+        """Test that check_exit_signals_batch returns the per-position results."""
+        positions = [
+            (JACKKNIFE_VALID["bars"], 0, 10.05, 9.00, "long"),
+            (STOP_HIT_SECOND_BAR["bars"], 0, 10.00, 9.50, "long"),
+            (STOP_HIT_SECOND_BAR["bars"], 0, 10.00, 10.15, "short"),
+            (JACKKNIFE_NOT_ENOUGH_BARS["bars"], 1, 10.05, 9.00, "long"),
+        ]
+        batch = self.detector.check_exit_signals_batch(*map(list, zip(*positions)))
+
+        assert len(batch) == len(positions)
+        for signals, (bars, entry_idx, entry_price, stop_price, direction) in zip(batch, positions):
+            assert signals == self.detector.check_exit_signals(
+                bars, entry_idx, entry_price, stop_price, direction
+            )
+        assert [s.signal_type for s in batch[0]] == ["jackknife"]
+        assert batch[3] == []
+
+    def test_per_position_macd_is_used(self):
+        """Test that a precomputed MACD frame is applied to its own position only."""
+        bars = MACD_CROSS_VALID["bars"]
+        entry_idx = MACD_CROSS_VALID["entry_idx"]
+        flat = self.detector.calculate_macd(bars["close"]).assign(macd=1.0, signal=0.0)
+
+        batch = self.detector.check_exit_signals_batch(
+            [bars, bars], [entry_idx, entry_idx], [10.0, 10.0], [1.0, 1.0],
+            ["long", "long"], macds=[None, flat],
+        )
+
+        assert "macd_cross" in [s.signal_type for s in batch[0]]
+        assert "macd_cross" not in [s.signal_type for s in batch[1]]
+
+    def test_mismatched_lengths_raise(self):
+        """Test that per-position arguments of different lengths are rejected."""
+        bars = JACKKNIFE_VALID["bars"]
+        with pytest.raises(ValueError, match="stop_prices"):
+            self.detector.check_exit_signals_batch(
+                [bars, bars], [0, 0], [10.05, 10.05], [9.00], ["long", "long"]
+            )
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -13,6 +13,7 @@ Patterns tested:
 Run with: pytest tests/test_reversal.py -v
 """
 
+import pandas as pd
 import pytest
 from candle_patterns import ReversalPatternDetector
 from tests.fixtures.reversal_fixtures import (
@@ -238,6 +239,27 @@ class TestReversalPatternDetection:
         if not result.detected:
             assert "stale" not in result.reason.lower()
 
+    def test_hod_recency_skips_nan_highs(self):
+        """Test that a NaN high (missing bar data) is not taken as the HOD."""
+        highs = [10.0] * 12 + [12.0] + [11.0] * 5
+        highs[-1] = float("nan")
+        df = pd.DataFrame({"high": highs})
+
+        fail, distance_pct = self.detector._check_hod_recency(df, 11.9, max_distance_pct=3.0)
+
+        assert fail is None
+        assert distance_pct == pytest.approx((12.0 - 11.9) / 12.0 * 100)
+
+    def test_hod_recency_all_nan_highs_rejected(self):
+        """Test that an all-NaN high window gives no signal instead of raising."""
+        df = pd.DataFrame({"high": [float("nan")] * 18})
+
+        fail, distance_pct = self.detector._check_hod_recency(df, 11.9, max_distance_pct=3.0)
+
+        assert fail is not None and fail.detected is False
+        assert "no hod" in fail.reason.lower()
+        assert distance_pct is None
+
     # =========================================================================
     # EXTENSION REQUIREMENT TESTS
     # =========================================================================
@@ -3,7 +3,11 @@
 import pandas as pd
 import pytest
 
-from candle_patterns.indicators.trend_confirmation import check_momentum_deceleration
+from candle_patterns.indicators.trend_confirmation import (
+    check_momentum_deceleration,
+    count_consecutive_dojis,
+    is_doji,
+)
 
 
 def _make_5min_bars(closes, volumes=None):
@@ -96,3 +100,20 @@ class TestMomentumDeceleration:
         passed, reason = check_momentum_deceleration(None)
         assert passed is False
         assert "insufficient" in reason.lower()
+
+
+class TestConsecutiveDojis:
+    def test_counts_trailing_dojis_like_is_doji(self):
+        bars = pd.DataFrame({
+            "open": [10.0, 10.0, 10.0, 10.0, 10.0],
+            "high": [10.5, 10.2, 10.0, 10.2, 10.3],
+            "low": [9.9, 9.8, 10.0, 9.9, 9.7],
+            "close": [10.4, 10.01, 10.0, 10.05, 10.02],
+        })
+        flags = [is_doji(row) for _, row in bars.iterrows()]
+
+        assert flags == [False, True, True, True, True]
+        assert count_consecutive_dojis(bars) == 4
+        assert count_consecutive_dojis(bars.iloc[:1]) == 0
+        assert count_consecutive_dojis(bars.iloc[1:]) == 4
+        assert count_consecutive_dojis(bars.iloc[:0]) == 0
@@ -8,6 +8,7 @@ Run with: pytest tests/test_vwap_bounce.py -v
 import pytest
 import pandas as pd
 from candle_patterns import VwapBounce
+from candle_patterns.indicators import macd as macd_module
 from tests.fixtures.vwap_bounce_fixtures import (
     VB_PASS_VALID,
     VB_PASS_MIN_CONSOL,
@@ -156,6 +157,21 @@ class TestVwapBounceDetection:
         assert not result.detected
 
 
+class TestVwapBounceDetectMany:
+    """Tests for PatternDetector.detect_many() with a VWAP series."""
+
+    def test_detect_many_slices_vwap_per_window(self):
+        bars, vwap = VB_PASS_VALID
+        ends = [len(bars) - 3, len(bars) - 2, len(bars) - 1]
+
+        results = VwapBounce().detect_many(bars, ends, vwap=vwap)
+
+        for end, result in zip(ends, results):
+            expected = VwapBounce().detect(bars.iloc[:end + 1], vwap.iloc[:end + 1])
+            assert result == expected
+        assert results[-1].detected
+
+
 class TestVwapBounceConfig:
     """Tests for VwapBounce configuration."""
 
@@ -177,6 +193,20 @@ class TestVwapBounceConfig:
         # Other defaults unchanged
         assert detector.config["min_consolidation_bars"] == 5
 
+    def test_min_confidence_gate(self):
+        bars, vwap = VB_PASS_VALID
+        confidence = VwapBounce().detect(bars, vwap).confidence
+
+        assert VwapBounce(config={"min_confidence": confidence}).detect(bars, vwap).detected
+
+        # Unreachable even with both MACD boosts: rejected before MACD is computed
+        macd_module._MACD_CACHE.clear()
+        detector = VwapBounce(config={"min_confidence": 0.95})
+        result = detector.detect(bars, vwap)
+        assert not result.detected
+        assert "even with MACD" in result.reason
+        assert macd_module._MACD_CACHE == []
+
     def test_no_min_vwap_slope_per_bar(self):
         """Verify min_vwap_slope_per_bar was removed (replaced by count approach)."""
         detector = VwapBounce()
@@ -1,7 +1,7 @@
 """Test VWAP handles out-of-order bars."""
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 
 from candle_patterns.indicators.vwap import calculate_vwap
 
@@ -27,3 +27,18 @@ class TestVWAPSort:
             vwap_shuffled.values,
             decimal=6,
         )
+
+    def test_reset_time_accumulates_each_side_separately(self):
+        """Bars before and after reset_time keep separate running sums."""
+        base = datetime(2024, 1, 15, 9, 28)
+        bars = pd.DataFrame({
+            "timestamp": pd.Series([base + timedelta(minutes=i) for i in range(4)]).dt.tz_localize("America/New_York"),
+            "high": [10.0, 10.2, 11.0, 11.2],
+            "low": [10.0, 10.2, 11.0, 11.2],
+            "close": [10.0, 10.2, 11.0, 11.2],
+            "volume": [100, 300, 200, 200],
+        })
+        vwap = calculate_vwap(bars, reset_time=time(9, 30))
+
+        np.testing.assert_array_almost_equal(vwap.values, [10.0, 10.15, 11.0, 11.1])
+        assert "typical_price" not in bars.columns